@@ -0,0 +1,138 @@
+import math
+from functools import lru_cache
+import numpy as np
+
+try:
+    from numba import cuda
+except ImportError:  # numba is optional; without it conflicts are checked on the CPU
+    cuda = None
+
+
+# Threads per block over the (segment, stacked segment) grid
+THREADS_PER_BLOCK = (16, 16)
+
+
+@lru_cache(maxsize=None)
+def is_available() -> bool:
+    """Whether numba can launch kernels on a CUDA device."""
+    return cuda is not None and cuda.is_available()
+
+
+if cuda is not None:
+    @cuda.jit(device=True)
+    def _interp(t, ts, values, lo, hi):
+        """Interpolate values[lo:hi] at time t, holding the end values outside ts (like np.interp)."""
+        if t <= ts[lo]:
+            return values[lo]
+        if t >= ts[hi - 1]:
+            return values[hi - 1]
+
+        # Binary search for the last waypoint at or before t
+        a, b = lo, hi - 1
+        while b - a > 1:
+            mid = (a + b) // 2
+            if ts[mid] <= t:
+                a = mid
+            else:
+                b = mid
+        slope = (values[a + 1] - values[a]) / (ts[a + 1] - ts[a])
+        return slope * (t - ts[a]) + values[a]
+
+    @cuda.jit
+    def segment_pairs(x1, y1, t1, seg_len1, xw, yw, tw, start, lo, hi, buffer,
+                      hit, hit_x, hit_y, hit_t, hit_d):
+        """
+        Check one (segment i, stacked segment s) pair per thread.
+
+        Stacked segment s runs from waypoint start[s] to start[s] + 1 of the
+        stacked arrays; its mission's waypoints are lo[s]:hi[s]. Writes the
+        same hit, intersection, time and distance values as
+        _kernels._segment_conflict into row i, column s of the outputs.
+        """
+        i, s = cuda.grid(2)
+        if i >= hit.shape[0] or s >= hit.shape[1]:
+            return
+        hit[i, s] = False
+
+        ax, ay, at = x1[i], y1[i], t1[i]
+        bx, by, bt = x1[i + 1], y1[i + 1], t1[i + 1]
+        k = start[s]
+        cx, cy, ct = xw[k], yw[k], tw[k]
+        ex, ey, et = xw[k + 1], yw[k + 1], tw[k + 1]
+
+        # Time windows must overlap and the lines must not be parallel; the
+        # tests are combined with & so neighbouring threads diverge less
+        denom = (ax - bx) * (cy - ey) - (ay - by) * (cx - ex)
+        if not ((ct <= bt) & (at <= et) & (denom != 0.0)):
+            return
+
+        t = ((ax - cx) * (cy - ey) - (ay - cy) * (cx - ex)) / denom
+        u = -((ax - bx) * (ay - cy) - (ay - by) * (ax - cx)) / denom
+        if not ((t >= 0.0) & (t <= 1.0) & (u >= 0.0) & (u <= 1.0)):
+            return
+
+        px = ax + t * (bx - ax)
+        py = ay + t * (by - ay)
+
+        # Conflict time from the distance travelled along the first segment
+        ratio = 0.0
+        if seg_len1[i] > 0:
+            ratio = math.hypot(px - ax, py - ay) / seg_len1[i]
+        conflict_t = at + ratio * (bt - at)
+
+        # Separation from the other drone's position at that moment
+        qx = _interp(conflict_t, tw, xw, lo[s], hi[s])
+        qy = _interp(conflict_t, tw, yw, lo[s], hi[s])
+        distance = math.hypot(px - qx, py - qy)
+
+        hit[i, s] = distance < buffer
+        hit_x[i, s] = px
+        hit_y[i, s] = py
+        hit_t[i, s] = conflict_t
+        hit_d[i, s] = distance
+
+
+def find_conflicts_stacked(x1, y1, t1, seg_len1, xw, yw, tw, offsets, counts, buffer):
+    """
+    Find conflicts between one mission and several others on the GPU.
+
+    Takes the same arguments as _kernels.find_conflicts_stacked: the other
+    missions' waypoints are stacked into xw, yw, tw, with mission m
+    occupying counts[m] entries from offsets[m]. Every (segment, stacked
+    segment) pair gets its own GPU thread.
+
+    Returns:
+        Tuple of (m, i, j, x, y, t, distance) arrays, one entry per conflict,
+        ordered by mission and then row-major (i, j)
+    """
+    n1 = max(len(x1) - 1, 0)
+    mission_id = np.repeat(np.arange(len(counts)), counts - 1)
+    is_last = np.zeros(len(xw), dtype=bool)
+    is_last[offsets + counts - 1] = True
+    start = np.flatnonzero(~is_last)
+    if n1 == 0 or len(start) == 0:
+        empty = np.empty(0)
+        return (np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64), np.empty(0, dtype=np.int64),
+                empty, empty, empty, empty)
+
+    lo = offsets[mission_id]
+    hi = lo + counts[mission_id]
+    shape = (n1, len(start))
+    hit = cuda.device_array(shape, dtype=np.bool_)
+    hit_x, hit_y, hit_t, hit_d = (cuda.device_array(shape, dtype=np.float64) for _ in range(4))
+
+    blocks = tuple((n + size - 1) // size for n, size in zip(shape, THREADS_PER_BLOCK))
+    segment_pairs[blocks, THREADS_PER_BLOCK](
+        *(cuda.to_device(np.ascontiguousarray(a)) for a in (x1, y1, t1, seg_len1, xw, yw, tw, start, lo, hi)),
+        float(buffer), hit, hit_x, hit_y, hit_t, hit_d
+    )
+
+    # Compact the hits in row-major order, then order them by mission
+    i, s = np.nonzero(hit.copy_to_host())
+    m = mission_id[s]
+    order = np.argsort(m, kind='stable')
+    i, s, m = i[order], s[order], m[order]
+    return (
+        m, i, s - offsets[m] + m,
+        *(column.copy_to_host()[i, s] for column in (hit_x, hit_y, hit_t, hit_d))
+    )
@@ -0,0 +1,214 @@
+import math
+import numpy as np
+
+try:
+    from numba import njit, prange
+    NUMBA_AVAILABLE = True
+except ImportError:  # numba is optional; the detector falls back to NumPy
+    NUMBA_AVAILABLE = False
+    prange = range
+
+    def njit(*args, **kwargs):
+        """Stand-in for numba.njit that leaves the function as plain Python."""
+        if len(args) == 1 and callable(args[0]) and not kwargs:
+            return args[0]
+        return lambda func: func
+
+
+# Explicit signatures compile the kernels eagerly at import (loading them from
+# the on-disk cache after the first run), so the first mission check does not
+# pay for JIT compilation. Waypoint arrays are normally C-contiguous; the
+# strided variants cover array views. numba specializes on dtype and layout,
+# not on array length, so one compiled version serves every waypoint count.
+_ARRAY_LAYOUTS = ('float64[::1]', 'float64[:]')
+_RESULT = 'Tuple((int64[::1], int64[::1], float64[::1], float64[::1], float64[::1], float64[::1]))'
+
+
+@njit([f'float64(float64, {a}, {a})' for a in _ARRAY_LAYOUTS], cache=True, boundscheck=False)
+def _interp(t, ts, values):
+    """Linearly interpolate values at time t, holding the end values outside ts (like np.interp)."""
+    n = ts.shape[0]
+    if t <= ts[0]:
+        return values[0]
+    if t >= ts[n - 1]:
+        return values[n - 1]
+    k = np.searchsorted(ts, t, side='right') - 1
+    slope = (values[k + 1] - values[k]) / (ts[k + 1] - ts[k])
+    return slope * (t - ts[k]) + values[k]
+
+
+@njit(cache=True, boundscheck=False)
+def _segment_conflict(ax, ay, at, bx, by, bt, length, cx, cy, ct, ex, ey, et, x2, y2, t2, buffer):
+    """
+    Check one segment pair for a conflict.
+
+    Segment (a, b) of the first mission, with x-y length length, is tested
+    against segment (c, e) of the second mission, whose full waypoint arrays
+    are x2, y2, t2. Checks temporal overlap and path intersection, then the
+    time the first drone reaches the intersection and the second drone's
+    distance from it at that moment.
+
+    Returns:
+        Tuple of (hit, x, y, t, distance); hit is False if there is no conflict
+    """
+    # Time windows must overlap and the lines must not be parallel. The
+    # comparisons are combined with & rather than short-circuit `or`, so they
+    # compile to flag arithmetic and one branch instead of one per test.
+    denom = (ax - bx) * (cy - ey) - (ay - by) * (cx - ex)
+    if not ((ct <= bt) & (at <= et) & (denom != 0.0)):
+        return False, 0.0, 0.0, 0.0, 0.0
+
+    t = ((ax - cx) * (cy - ey) - (ay - cy) * (cx - ex)) / denom
+    u = -((ax - bx) * (ay - cy) - (ay - by) * (ax - cx)) / denom
+    if not ((t >= 0.0) & (t <= 1.0) & (u >= 0.0) & (u <= 1.0)):
+        return False, 0.0, 0.0, 0.0, 0.0
+
+    px = ax + t * (bx - ax)
+    py = ay + t * (by - ay)
+
+    # Conflict time from the distance travelled along the first segment
+    ratio = 0.0
+    if length > 0:
+        ratio = math.hypot(px - ax, py - ay) / length
+    conflict_t = at + ratio * (bt - at)
+
+    # Separation from the second drone's position at that moment
+    qx = _interp(conflict_t, t2, x2)
+    qy = _interp(conflict_t, t2, y2)
+    distance = math.hypot(px - qx, py - qy)
+    return distance < buffer, px, py, conflict_t, distance
+
+
+@njit([f'{_RESULT}({a}, {a}, {a}, {a}, {a}, {a}, {a}, float64)' for a in _ARRAY_LAYOUTS],
+      cache=True, parallel=True, boundscheck=False)
+def find_conflicts(x1, y1, t1, seg_len1, x2, y2, t2, buffer):
+    """
+    Find conflicts between two missions in one fused pass over segment pairs.
+
+    Each mission is given as waypoint coordinate and time (epoch seconds)
+    arrays; segment i runs from waypoint i to i + 1. seg_len1 holds the
+    lengths of the first mission's segments. For every pair the kernel checks
+    temporal overlap and path intersection, then the time the first drone
+    reaches the intersection and the second drone's distance from it at that
+    moment, without leaving compiled code.
+
+    Returns:
+        Tuple of (i, j, x, y, t, distance) arrays, one entry per conflict in
+        row-major (i, j) order
+    """
+    n1 = x1.shape[0] - 1
+    n2 = x2.shape[0] - 1
+    hit = np.zeros((max(n1, 0), max(n2, 0)), dtype=np.bool_)
+    hit_x = np.empty(hit.shape, dtype=np.float64)
+    hit_y = np.empty(hit.shape, dtype=np.float64)
+    hit_t = np.empty(hit.shape, dtype=np.float64)
+    hit_d = np.empty(hit.shape, dtype=np.float64)
+
+    for i in prange(n1):
+        for j in range(n2):
+            hit[i, j], hit_x[i, j], hit_y[i, j], hit_t[i, j], hit_d[i, j] = _segment_conflict(
+                x1[i], y1[i], t1[i], x1[i + 1], y1[i + 1], t1[i + 1], seg_len1[i],
+                x2[j], y2[j], t2[j], x2[j + 1], y2[j + 1], t2[j + 1], x2, y2, t2, buffer
+            )
+
+    # Compact the hits in row-major order
+    count = 0
+    for i in range(hit.shape[0]):
+        for j in range(hit.shape[1]):
+            if hit[i, j]:
+                count += 1
+
+    i_idx = np.empty(count, dtype=np.int64)
+    j_idx = np.empty(count, dtype=np.int64)
+    xs = np.empty(count, dtype=np.float64)
+    ys = np.empty(count, dtype=np.float64)
+    ts = np.empty(count, dtype=np.float64)
+    distances = np.empty(count, dtype=np.float64)
+    k = 0
+    for i in range(hit.shape[0]):
+        for j in range(hit.shape[1]):
+            if hit[i, j]:
+                i_idx[k] = i
+                j_idx[k] = j
+                xs[k] = hit_x[i, j]
+                ys[k] = hit_y[i, j]
+                ts[k] = hit_t[i, j]
+                distances[k] = hit_d[i, j]
+                k += 1
+
+    return i_idx, j_idx, xs, ys, ts, distances
+
+
+@njit('Tuple((int64[::1], int64[::1], int64[::1], float64[::1], float64[::1], float64[::1], float64[::1]))'
+      '(float64[::1], float64[::1], float64[::1], float64[::1], '
+      'float64[::1], float64[::1], float64[::1], int64[::1], int64[::1], float64)',
+      cache=True, parallel=True, boundscheck=False)
+def find_conflicts_stacked(x1, y1, t1, seg_len1, xw, yw, tw, offsets, counts, buffer):
+    """
+    Find conflicts between one mission and several others in one compiled pass.
+
+    The other missions' waypoints are stacked into xw, yw, tw; mission m
+    occupies counts[m] entries starting at offsets[m]. The missions are
+    checked in parallel, each against every segment of the first mission.
+
+    Returns:
+        Tuple of (m, i, j, x, y, t, distance) arrays, one entry per conflict,
+        ordered by mission and then row-major (i, j)
+    """
+    n1 = max(x1.shape[0] - 1, 0)
+    num_missions = offsets.shape[0]
+
+    # Mission m's segment pairs occupy n1 * (counts[m] - 1) buffer slots
+    # starting at n1 * (offsets[m] - m)
+    total = 0
+    for m in range(num_missions):
+        total += counts[m] - 1
+    hit = np.zeros(n1 * total, dtype=np.bool_)
+    hit_x = np.empty(n1 * total, dtype=np.float64)
+    hit_y = np.empty(n1 * total, dtype=np.float64)
+    hit_t = np.empty(n1 * total, dtype=np.float64)
+    hit_d = np.empty(n1 * total, dtype=np.float64)
+
+    for m in prange(num_missions):
+        lo = offsets[m]
+        hi = lo + counts[m]
+        x2, y2, t2 = xw[lo:hi], yw[lo:hi], tw[lo:hi]
+        n2 = counts[m] - 1
+        base = n1 * (lo - m)
+        for i in range(n1):
+            for j in range(n2):
+                k = base + i * n2 + j
+                hit[k], hit_x[k], hit_y[k], hit_t[k], hit_d[k] = _segment_conflict(
+                    x1[i], y1[i], t1[i], x1[i + 1], y1[i + 1], t1[i + 1], seg_len1[i],
+                    x2[j], y2[j], t2[j], x2[j + 1], y2[j + 1], t2[j + 1], x2, y2, t2, buffer
+                )
+
+    # Compact the hits, keeping the mission / row-major order of the buffer
+    count = 0
+    for k in range(hit.shape[0]):
+        if hit[k]:
+            count += 1
+
+    m_idx = np.empty(count, dtype=np.int64)
+    i_idx = np.empty(count, dtype=np.int64)
+    j_idx = np.empty(count, dtype=np.int64)
+    xs = np.empty(count, dtype=np.float64)
+    ys = np.empty(count, dtype=np.float64)
+    ts = np.empty(count, dtype=np.float64)
+    distances = np.empty(count, dtype=np.float64)
+    c = 0
+    for m in range(num_missions):
+        n2 = counts[m] - 1
+        base = n1 * (offsets[m] - m)
+        for k in range(base, base + n1 * n2):
+            if hit[k]:
+                m_idx[c] = m
+                i_idx[c] = (k - base) // n2
+                j_idx[c] = (k - base) % n2
+                xs[c] = hit_x[k]
+                ys[c] = hit_y[k]
+                ts[c] = hit_t[k]
+                distances[c] = hit_d[k]
+                c += 1
+
+    return m_idx, i_idx, j_idx, xs, ys, ts, distances
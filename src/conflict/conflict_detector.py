@@ -1,10 +1,50 @@
 from typing import List, Dict, Tuple, Optional
 from datetime import datetime, timedelta
+import math
+import os
+import threading
+from bisect import bisect_right
+from collections import OrderedDict
+from concurrent.futures import ThreadPoolExecutor
+from functools import partial
 import numpy as np
-from dataclasses import dataclass
-from models.mission import Mission, Waypoint
+from dataclasses import dataclass, field
+from models.mission import Mission, Waypoint, to_epoch
+from conflict import _kernels, _cuda_kernel
 
-@dataclass
+try:
+    from rtree import index as rtree_index
+except ImportError:  # rtree is optional; large missions fall back to brute force
+    rtree_index = None
+
+# rtree indexes are not safe to query from several threads at once
+_INDEX_LOCK = threading.Lock()
+
+# Mission pairs with at most this many waypoint combinations are checked with
+# plain Python floats when numba is unavailable; NumPy wins above it
+SCALAR_MAX_PAIRS = 400
+
+# Without numba, checks against at least this many missions are spread over a
+# thread pool (NumPy releases the GIL inside its array operations)
+PARALLEL_MIN_MISSIONS = 16
+
+# Without numba, checks against at least this many small missions are stacked
+# into batched NumPy passes (the compiled driver batches any number). Batches
+# hold at most BATCH_MAX_PAIRS segment pairs each.
+BATCH_MIN_MISSIONS = 12
+BATCH_MAX_PAIRS = 1 << 18
+
+# With a CUDA device in use, batches of at least this many segment pairs are
+# checked on the GPU; below it launch and transfer costs outweigh the gain
+CUDA_MIN_PAIRS = 1 << 14
+
+# Raw conflict record: intersection point, conflict time (epoch seconds),
+# separation, and the indices of the two segments involved
+CONFLICT_DTYPE = np.dtype([
+    ('ix', 'f8'), ('iy', 'f8'), ('t', 'f8'), ('dist', 'f8'), ('i1', 'i4'), ('i2', 'i4')
+])
+
+@dataclass(slots=True)
 class Conflict:
     """Class to store conflict information."""
     location: Tuple[float, float]  # (x, y) coordinates of conflict
@@ -12,19 +52,53 @@ class Conflict:
     primary_drone: str  # ID of primary drone
     conflicting_drone: str  # ID of conflicting drone
     distance: float  # Distance between drones at conflict point
-    description: str  # Human-readable description of the conflict
+    _time_str: Optional[str] = field(default=None, init=False, repr=False, compare=False)  # see time_str
+    
+    @property
+    def time_str(self) -> str:
+        """Conflict time formatted as HH:MM:SS, computed on first use."""
+        if self._time_str is None:
+            self._time_str = self.time.strftime('%H:%M:%S')
+        return self._time_str
+    
+    @property
+    def description(self) -> str:
+        """Human-readable description of the conflict, built only when read."""
+        return (f"Conflict between {self.primary_drone} and {self.conflicting_drone} "
+                f"at ({self.location[0]:.2f}, {self.location[1]:.2f}) "
+                f"at time {self.time_str} "
+                f"with distance {self.distance:.2f}m")
 
 class ConflictDetector:
     """Class to detect conflicts between drone missions."""
     
-    def __init__(self, safety_buffer: float = 50.0):
+    def __init__(self, safety_buffer: float = 50.0, rtree_threshold: int = 32, device: str = 'auto',
+                 cache_size: int = 8):
         """
         Initialize the conflict detector.
         
         Args:
             safety_buffer: Minimum safe distance between drones in meters
+            rtree_threshold: Waypoint count above which segment pairs are pruned
+                with an R-tree (if rtree is installed); pairs of missions with
+                more than rtree_threshold**2 waypoint combinations use the index
+            device: 'cuda' to check large batches of missions on the GPU
+                (needs numba and a CUDA device), 'cpu' to never use it, or
+                'auto' to use the GPU if one is available
+            cache_size: Number of recent check_mission results kept, so that
+                checking the same scenario again skips detection; 0 disables
+                the cache
         """
+        if device not in ('auto', 'cpu', 'cuda'):
+            raise ValueError(f"Unknown device: {device}")
+        if device == 'cuda' and not _cuda_kernel.is_available():
+            raise ValueError("CUDA device requested but none is available")
+        
         self.safety_buffer = safety_buffer
+        self.rtree_threshold = rtree_threshold
+        self.use_cuda = device != 'cpu' and _cuda_kernel.is_available()
+        self.cache_size = cache_size
+        self._results: "OrderedDict[tuple, Tuple[str, List[Conflict]]]" = OrderedDict()
     
     def check_mission(self, primary_mission: Mission, other_missions: List[Mission]) -> Tuple[str, List[Conflict]]:
         """
@@ -39,118 +113,660 @@ class ConflictDetector:
             - status: "clear" or "conflict detected"
             - conflicts: List of Conflict objects describing detected conflicts
         """
-        conflicts = []
+        if self.cache_size <= 0:
+            return self._detect(primary_mission, other_missions)
         
-        # Check each other mission against the primary mission
-        for other_mission in other_missions:
-            mission_conflicts = self._check_mission_pair(primary_mission, other_mission)
-            conflicts.extend(mission_conflicts)
+        # Repeated checks of the same scenario are answered from the cache,
+        # keyed on the missions' full waypoint data
+        key = (self._mission_key(primary_mission),
+               tuple(self._mission_key(mission) for mission in other_missions))
+        cached = self._results.get(key)
+        if cached is not None:
+            self._results.move_to_end(key)
+            return cached[0], list(cached[1])
+        
+        status, conflicts = self._detect(primary_mission, other_missions)
+        self._results[key] = (status, conflicts)
+        if len(self._results) > self.cache_size:
+            self._results.popitem(last=False)
+        return status, list(conflicts)
+    
+    @staticmethod
+    def _mission_key(mission: Mission) -> tuple:
+        """Cache key for a mission: its drone ID and raw waypoint position and time bytes."""
+        return mission.drone_id, mission.xyz.tobytes(), mission.ts_epoch.tobytes()
+    
+    def _detect(self, primary_mission: Mission, other_missions: List[Mission]) -> Tuple[str, List[Conflict]]:
+        """Run conflict detection for check_mission, without the result cache."""
+        candidates = [
+            other_mission for other_mission in other_missions
+            if self._may_conflict(primary_mission, other_mission)
+        ]
+        
+        # Conflict objects are only built once all pairs have been checked
+        found = [
+            (other_mission, records)
+            for other_mission, records in zip(candidates, self._check_missions(primary_mission, candidates))
+            if len(records)
+        ]
+        
+        conflicts = [
+            conflict
+            for other_mission, records in found
+            for conflict in self._materialize(primary_mission, other_mission, records)
+        ]
         
         if conflicts:
             return "conflict detected", conflicts
         return "clear", []
     
-    def _check_mission_pair(self, mission1: Mission, mission2: Mission) -> List[Conflict]:
+    def _may_conflict(self, mission1: Mission, mission2: Mission) -> bool:
+        """
+        Cheap check whether two missions can conflict at all.
+        
+        Returns False when the missions' bounding boxes, grown by the safety
+        buffer, are disjoint or their time windows do not overlap.
+        """
+        x1_min, x1_max, y1_min, y1_max = mission1.bbox
+        x2_min, x2_max, y2_min, y2_max = mission2.bbox
+        buffer = self.safety_buffer
+        
+        if x1_min > x2_max + buffer or x2_min > x1_max + buffer:
+            return False
+        if y1_min > y2_max + buffer or y2_min > y1_max + buffer:
+            return False
+        return not (mission1.tbox[0] > mission2.tbox[1] or mission2.tbox[0] > mission1.tbox[1])
+    
+    def _check_missions(self, mission1: Mission, missions: List[Mission]) -> List[np.ndarray]:
+        """
+        Check mission1 against each of several missions.
+        
+        When there are many missions, those too small for the R-tree are
+        stacked and checked in batched passes; the rest are checked pair by
+        pair, on a thread pool when numba is unavailable and there are many.
+        
+        Returns:
+            One structured array of CONFLICT_DTYPE records per mission, in order
+        """
+        results = [None] * len(missions)
+        pending = list(range(len(missions)))
+        
+        # The compiled driver is cheap to call, so it is used for any batch
+        min_batch = 2 if _kernels.NUMBA_AVAILABLE else BATCH_MIN_MISSIONS
+        if len(missions) >= min_batch:
+            stackable = [k for k in pending if not self._use_index(mission1, missions[k])]
+            pending = [k for k in pending if self._use_index(mission1, missions[k])]
+            
+            # Bound the (segments1, stacked segments) arrays of each batch
+            max_segments = max(BATCH_MAX_PAIRS // max(len(mission1.xs) - 1, 1), 1)
+            batch, segments = [], 0
+            for k in stackable + [None]:
+                size = len(missions[k].xs) - 1 if k is not None else 0
+                if batch and (k is None or segments + size > max_segments):
+                    batch_results = self._check_missions_batched(mission1, [missions[b] for b in batch])
+                    for b, records in zip(batch, batch_results):
+                        results[b] = records
+                    batch, segments = [], 0
+                if k is not None:
+                    batch.append(k)
+                    segments += size
+        
+        # Each remaining pair is independent. The compiled kernel already runs in
+        # parallel; otherwise many pairs are checked on a thread pool.
+        pending_missions = [missions[k] for k in pending]
+        
+        # Pairs pruned with the R-tree share one index over mission1's segments
+        index = None
+        if any(self._use_index(mission1, mission) for mission in pending_missions):
+            index = self._segment_index(mission1)
+        check_pair = partial(self._check_mission_pair, mission1, index=index)
+        workers = min(os.cpu_count() or 1, len(pending))
+        if not _kernels.NUMBA_AVAILABLE and len(pending) >= PARALLEL_MIN_MISSIONS and workers > 1:
+            with ThreadPoolExecutor(max_workers=workers) as pool:
+                pair_results = list(pool.map(check_pair, pending_missions))
+        else:
+            pair_results = map(check_pair, pending_missions)
+        for k, records in zip(pending, pair_results):
+            results[k] = records
+        
+        return results
+    
+    def _use_index(self, mission1: Mission, mission2: Mission) -> bool:
+        """Whether a mission pair is large enough to prune segment pairs with the R-tree."""
+        # A mission1 without segments has nothing to index (rtree rejects an
+        # empty bulk load)
+        if rtree_index is None or len(mission1.waypoints) < 2:
+            return False
+        num_pairs = len(mission1.waypoints) * len(mission2.waypoints)
+        return num_pairs > self.rtree_threshold ** 2
+    
+    def _check_mission_pair(self, mission1: Mission, mission2: Mission,
+                            index: Optional['rtree_index.Index'] = None) -> np.ndarray:
         """
         Check for conflicts between two missions.
         
         Args:
             mission1: First mission
             mission2: Second mission
+            index: Optional prebuilt R-tree over mission1's segments
             
         Returns:
-            List of Conflict objects describing detected conflicts
+            Structured array of CONFLICT_DTYPE records, one per detected conflict
         """
-        conflicts = []
+        # Every path below yields (i, j, x, y, t, distance) hits in row-major
+        # (i, j) order. Large missions prune candidate pairs with an R-tree;
+        # otherwise temporal overlap, intersection, conflict time and separation
+        # are computed together in one pass over the segment pairs, by the
+        # compiled kernel when numba is installed.
+        num_pairs = len(mission1.waypoints) * len(mission2.waypoints)
+        if self._use_index(mission1, mission2):
+            hits = self._find_conflicts_vectorized(mission1, mission2, indexed=True, index=index)
+        elif _kernels.NUMBA_AVAILABLE:
+            hits = _kernels.find_conflicts(
+                mission1.xs, mission1.ys, mission1.ts_epoch, mission1.seg_len,
+                mission2.xs, mission2.ys, mission2.ts_epoch,
+                float(self.safety_buffer)
+            )
+        elif num_pairs <= SCALAR_MAX_PAIRS:
+            hits = self._find_conflicts_scalar(mission1, mission2)
+        else:
+            hits = self._find_conflicts_vectorized(mission1, mission2)
         
-        # Get all waypoint pairs that could potentially conflict
-        for i in range(len(mission1.waypoints) - 1):
-            for j in range(len(mission2.waypoints) - 1):
-                wp1_start = mission1.waypoints[i]
-                wp1_end = mission1.waypoints[i + 1]
-                wp2_start = mission2.waypoints[j]
-                wp2_end = mission2.waypoints[j + 1]
+        return self._to_records(hits)
+    
+    def _check_missions_batched(self, mission1: Mission, missions: List[Mission]) -> List[np.ndarray]:
+        """
+        Check mission1 against several missions in one stacked pass.
+        
+        The waypoints of all missions are concatenated and checked together: on
+        the GPU for large batches when a CUDA device is in use, by the compiled
+        kernel (in parallel over missions) when numba is installed, or with
+        whole-array NumPy operations otherwise.
+        
+        Returns:
+            One structured array of CONFLICT_DTYPE records per mission, in order
+        """
+        # Stacked waypoint arrays; mission m occupies counts[m] entries from offsets[m]
+        counts = np.array([len(m.xs) for m in missions], dtype=np.int64)
+        offsets = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64)
+        xw = np.concatenate([m.xs for m in missions])
+        yw = np.concatenate([m.ys for m in missions])
+        tw = np.concatenate([m.ts_epoch for m in missions])
+        
+        num_pairs = (len(mission1.xs) - 1) * (len(xw) - len(missions))
+        if self.use_cuda and num_pairs >= CUDA_MIN_PAIRS:
+            hits = _cuda_kernel.find_conflicts_stacked(
+                mission1.xs, mission1.ys, mission1.ts_epoch, mission1.seg_len,
+                xw, yw, tw, offsets, counts, float(self.safety_buffer)
+            )
+        elif _kernels.NUMBA_AVAILABLE:
+            hits = _kernels.find_conflicts_stacked(
+                mission1.xs, mission1.ys, mission1.ts_epoch, mission1.seg_len,
+                xw, yw, tw, offsets, counts, float(self.safety_buffer)
+            )
+        else:
+            hits = self._find_conflicts_stacked(mission1, xw, yw, tw, offsets, counts)
+        
+        # Split the hits, ordered by mission, into one record array per mission
+        m = hits[0]
+        records = np.empty(len(m), dtype=CONFLICT_DTYPE)
+        for name, column in zip(('i1', 'i2', 'ix', 'iy', 't', 'dist'), hits[1:]):
+            records[name] = column
+        bounds = np.searchsorted(m, np.arange(len(missions) + 1)).tolist()
+        return [self._drop_duplicates(records[lo:hi]) for lo, hi in zip(bounds[:-1], bounds[1:])]
+    
+    def _find_conflicts_stacked(self, mission1: Mission, xw: np.ndarray, yw: np.ndarray, tw: np.ndarray,
+                                offsets: np.ndarray, counts: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Find conflicts between mission1 and stacked missions with NumPy.
+        
+        Each stacked segment is tagged with the index of its mission, and all
+        (segment, stacked segment) pairs are solved at once. Conflict times and
+        the other drones' positions are then computed for all hits together.
+        
+        Returns:
+            Tuple of (m, i, j, x, y, t, distance) arrays, as
+            _kernels.find_conflicts_stacked
+        """
+        mission_id = np.repeat(np.arange(len(counts)), counts - 1)
+        is_last = np.zeros(len(xw), dtype=bool)
+        is_last[offsets + counts - 1] = True
+        start = np.flatnonzero(~is_last)
+        
+        x1, y1, ts1 = mission1.xs, mission1.ys, mission1.ts_epoch
+        
+        # Candidate (segment, stacked segment) pairs: overlapping time windows
+        # and overlapping float32 bounding boxes
+        overlap = (tw[None, start] <= ts1[1:, None]) & (ts1[:-1, None] <= tw[None, start + 1])
+        x1min, x1max, y1min, y1max = self._segment_boxes32(x1[:-1], y1[:-1], x1[1:], y1[1:])
+        x2min, x2max, y2min, y2max = self._segment_boxes32(xw[start], yw[start], xw[start + 1], yw[start + 1])
+        overlap &= (x1min[:, None] <= x2max[None, :]) & (x2min[None, :] <= x1max[:, None])
+        overlap &= (y1min[:, None] <= y2max[None, :]) & (y2min[None, :] <= y1max[:, None])
+        i, s = np.nonzero(overlap)
+        
+        # Exact float64 intersections of the candidates only
+        x1s, y1s = x1[i], y1[i]
+        x1e, y1e = x1[i + 1], y1[i + 1]
+        t, _, mask = self._solve_intersections(
+            x1s, y1s, x1e, y1e,
+            xw[start[s]], yw[start[s]], xw[start[s] + 1], yw[start[s] + 1]
+        )
+        i, s, t = i[mask], s[mask], t[mask]
+        x = x1s[mask] + t * (x1e[mask] - x1s[mask])
+        y = y1s[mask] + t * (y1e[mask] - y1s[mask])
+        
+        # Conflict time from the distance travelled along mission1's segment
+        seg_len = mission1.seg_len[i]
+        travelled = np.hypot(x - x1[i], y - y1[i])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(seg_len > 0, travelled / seg_len, 0.0)
+        conflict_t = ts1[i] + ratio * (ts1[i + 1] - ts1[i])
+        
+        # Each other drone's position at that moment, held outside its schedule
+        m = mission_id[s]
+        first, last = offsets[m], offsets[m] + counts[m] - 1
+        clamped = np.clip(conflict_t, tw[first], tw[last])
+        k = np.clip(self._stacked_searchsorted(tw, counts, m, clamped), first, np.maximum(last - 1, first))
+        elapsed, span = clamped - tw[k], tw[k + 1] - tw[k]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            qx = (xw[k + 1] - xw[k]) / span * elapsed + xw[k]
+            qy = (yw[k + 1] - yw[k]) / span * elapsed + yw[k]
+        # The end tests use the unclamped time, as the other paths do; when all
+        # of a mission's waypoints share one time, clamping would always
+        # select its first waypoint
+        before, after = conflict_t <= tw[first], conflict_t >= tw[last]
+        qx = np.where(before, xw[first], np.where(after, xw[last], qx))
+        qy = np.where(before, yw[first], np.where(after, yw[last], qy))
+        distance = np.hypot(x - qx, y - qy)
+        
+        # Order the hits by mission, each in row-major (i, j) order
+        keep = distance < self.safety_buffer
+        order = np.argsort(m[keep], kind='stable')
+        return tuple(
+            column[keep][order]
+            for column in (m, i, s - offsets[m] + m, x, y, conflict_t, distance)
+        )
+    
+    @staticmethod
+    def _segment_boxes32(xs: np.ndarray, ys: np.ndarray,
+                         xe: np.ndarray, ye: np.ndarray) -> Tuple[np.ndarray, ...]:
+        """
+        Bounding boxes (xmin, xmax, ymin, ymax) of segments, in float32.
+        
+        Comparing float32 boxes halves the memory traffic of screening many
+        segment pairs. Rounding to float32 keeps the order of values, so
+        boxes that touch or overlap in float64 still do; the screen never
+        drops an intersecting pair.
+        """
+        xs, ys, xe, ye = (a.astype(np.float32) for a in (xs, ys, xe, ye))
+        return np.minimum(xs, xe), np.maximum(xs, xe), np.minimum(ys, ye), np.maximum(ys, ye)
+    
+    @staticmethod
+    def _stacked_searchsorted(tw: np.ndarray, counts: np.ndarray,
+                              mission_id: np.ndarray, values: np.ndarray) -> np.ndarray:
+        """
+        Index of the last waypoint at or before each value, searching only the
+        stacked waypoint times of the value's own mission.
+        """
+        # Shift each mission's times into its own disjoint range so one sorted
+        # search covers all of them
+        base = tw.min()
+        span = tw.max() - base + 1.0
+        keys = (tw - base) + np.repeat(np.arange(len(counts)), counts) * span
+        return np.searchsorted(keys, (values - base) + mission_id * span, side='right') - 1
+    
+    def _to_records(self, hits: Tuple[np.ndarray, ...]) -> np.ndarray:
+        """Copy (i, j, x, y, t, distance) hits into a CONFLICT_DTYPE record buffer, without duplicates."""
+        records = np.empty(len(hits[0]), dtype=CONFLICT_DTYPE)
+        for name, column in zip(('i1', 'i2', 'ix', 'iy', 't', 'dist'), hits):
+            records[name] = column
+        return self._drop_duplicates(records)
+    
+    def _materialize(self, mission1: Mission, mission2: Mission, records: np.ndarray) -> List[Conflict]:
+        """Build Conflict objects from the conflict records of a mission pair."""
+        waypoints = mission1.waypoints
+        return [
+            self._create_conflict(
+                mission1, mission2, (x, y), self._epoch_to_datetime(waypoints[i], t), distance
+            )
+            for x, y, t, distance, i in zip(
+                records['ix'].tolist(), records['iy'].tolist(), records['t'].tolist(),
+                records['dist'].tolist(), records['i1'].tolist()
+            )
+        ]
+    
+    def _find_conflicts_scalar(self, mission1: Mission, mission2: Mission) -> Tuple[list, ...]:
+        """
+        Find conflicts between two small missions in one fused pure-Python pass.
+        
+        Each segment pair is checked for temporal overlap, intersected, timed and
+        measured against the other drone's position in sequence, with every
+        coordinate loaded once into a local. For a handful of waypoints this
+        beats NumPy, whose per-call overhead dominates at that size.
+        
+        Returns:
+            Tuple of (i, j, x, y, t, distance) lists, as _kernels.find_conflicts
+        """
+        x1, y1 = mission1.xs.tolist(), mission1.ys.tolist()
+        t1, seg_len1 = mission1.ts_epoch.tolist(), mission1.seg_len.tolist()
+        x2, y2, t2 = mission2.xs.tolist(), mission2.ys.tolist(), mission2.ts_epoch.tolist()
+        buffer = self.safety_buffer
+        hypot = math.hypot
+        first_t, last_t = t2[0], t2[-1]
+        hits = ([], [], [], [], [], [])
+        
+        # Segments as (start, end) coordinate tuples, iterated without indexing
+        segments1 = zip(x1, y1, t1, x1[1:], y1[1:], t1[1:], seg_len1)
+        segments2 = list(zip(x2, y2, t2, x2[1:], y2[1:], t2[1:]))
+        
+        for i, (ax, ay, at, bx, by, bt, length) in enumerate(segments1):
+            dx1, dy1 = ax - bx, ay - by
+            
+            for j, (cx, cy, ct, ex, ey, et) in enumerate(segments2):
+                # Time windows must overlap
+                if bt < ct or et < at:
+                    continue
+                
+                dx2, dy2 = cx - ex, cy - ey
+                denom = dx1 * dy2 - dy1 * dx2
+                if denom == 0:  # Lines are parallel
+                    continue
+                t = ((ax - cx) * dy2 - (ay - cy) * dx2) / denom
+                u = -(dx1 * (ay - cy) - dy1 * (ax - cx)) / denom
+                if t < 0 or t > 1 or u < 0 or u > 1:
+                    continue
+                
+                px = ax + t * (bx - ax)
+                py = ay + t * (by - ay)
+                
+                # Conflict time from the distance travelled along the first segment
+                ratio = hypot(px - ax, py - ay) / length if length > 0 else 0
+                conflict_t = at + ratio * (bt - at)
                 
-                # Check if time windows overlap
-                if self._check_temporal_overlap(wp1_start, wp1_end, wp2_start, wp2_end):
-                    # Check for spatial conflict
-                    conflict_point = self._find_intersection(
-                        wp1_start, wp1_end, wp2_start, wp2_end
-                    )
-                    
-                    if conflict_point:
-                        conflict_time = self._calculate_conflict_time(
-                            wp1_start, wp1_end, wp2_start, wp2_end, conflict_point
-                        )
-                        
-                        if conflict_time:
-                            distance = self._calculate_distance(
-                                wp1_start, wp2_start, conflict_point
-                            )
-                            
-                            if distance < self.safety_buffer:
-                                conflicts.append(Conflict(
-                                    location=conflict_point,
-                                    time=conflict_time,
-                                    primary_drone=mission1.drone_id,
-                                    conflicting_drone=mission2.drone_id,
-                                    distance=distance,
-                                    description=f"Conflict between {mission1.drone_id} and {mission2.drone_id} "
-                                              f"at ({conflict_point[0]:.2f}, {conflict_point[1]:.2f}) "
-                                              f"at time {conflict_time.strftime('%H:%M:%S')} "
-                                              f"with distance {distance:.2f}m"
-                                ))
-        
-        return conflicts
-    
-    def _check_temporal_overlap(self, 
-                              wp1_start: Waypoint, wp1_end: Waypoint,
-                              wp2_start: Waypoint, wp2_end: Waypoint) -> bool:
-        """Check if two time windows overlap."""
-        return not (wp1_end.timestamp < wp2_start.timestamp or 
-                   wp2_end.timestamp < wp1_start.timestamp)
+                # Other drone's position at that moment, held outside its schedule
+                if conflict_t <= first_t:
+                    qx, qy = x2[0], y2[0]
+                elif conflict_t >= last_t:
+                    qx, qy = x2[-1], y2[-1]
+                else:
+                    k = bisect_right(t2, conflict_t) - 1
+                    frac = conflict_t - t2[k]
+                    span = t2[k + 1] - t2[k]
+                    qx = (x2[k + 1] - x2[k]) / span * frac + x2[k]
+                    qy = (y2[k + 1] - y2[k]) / span * frac + y2[k]
+                
+                distance = hypot(px - qx, py - qy)
+                if distance < buffer:
+                    for column, value in zip(hits, (i, j, px, py, conflict_t, distance)):
+                        column.append(value)
+        
+        return hits
+    
+    def _find_conflicts_vectorized(self, mission1: Mission, mission2: Mission, indexed: bool = False,
+                                   index: Optional['rtree_index.Index'] = None) -> Tuple[np.ndarray, ...]:
+        """
+        Find conflicts between two missions with whole-array NumPy operations.
+        
+        Intersections are solved for all temporally overlapping segment pairs
+        (pruned with an R-tree, optionally the prebuilt index, if indexed is
+        True); conflict times and
+        separations are then computed for all hits at once.
+        
+        Returns:
+            Tuple of (i, j, x, y, t, distance) arrays, as _kernels.find_conflicts
+        """
+        # Only segment pairs whose time windows overlap can conflict
+        overlap = self._temporal_overlap_mask(mission1, mission2)
+        if not overlap.any():
+            empty = np.empty(0)
+            return np.empty(0, dtype=np.intp), np.empty(0, dtype=np.intp), empty, empty, empty, empty
+        
+        if indexed:
+            i, j, _, _, x, y = self._find_intersections_indexed(mission1, mission2, overlap, index)
+        else:
+            i, j, _, _, x, y = self._find_intersections(mission1, mission2, overlap)
+        
+        # Conflict time from the distance travelled along mission1's segment
+        xs1, ys1, ts1, seg_len = mission1.xs, mission1.ys, mission1.ts_epoch, mission1.seg_len[i]
+        travelled = np.hypot(x - xs1[i], y - ys1[i])
+        with np.errstate(divide='ignore', invalid='ignore'):
+            ratio = np.where(seg_len > 0, travelled / seg_len, 0.0)
+        t = ts1[i] + ratio * (ts1[i + 1] - ts1[i])
+        
+        # Separation from mission2's drone at that moment
+        qx, qy = self._positions_at(mission2, t)
+        distance = np.hypot(x - qx, y - qy)
+        
+        keep = distance < self.safety_buffer
+        return i[keep], j[keep], x[keep], y[keep], t[keep], distance[keep]
+    
+    @staticmethod
+    def _positions_at(mission: Mission, t: np.ndarray) -> Tuple[np.ndarray, np.ndarray]:
+        """
+        A mission's drone x-y positions at epoch times t, held outside its schedule.
+        
+        Interpolates like _kernels._interp rather than np.interp, whose result
+        is unspecified where waypoints share a timestamp; at such a time the
+        drone is at the first of those waypoints, as on the other paths.
+        """
+        ts, xs, ys = mission.ts_epoch, mission.xs, mission.ys
+        k = np.clip(np.searchsorted(ts, t, side='right') - 1, 0, max(len(ts) - 2, 0))
+        k1 = np.minimum(k + 1, len(ts) - 1)
+        elapsed, span = t - ts[k], ts[k1] - ts[k]
+        with np.errstate(divide='ignore', invalid='ignore'):
+            qx = (xs[k1] - xs[k]) / span * elapsed + xs[k]
+            qy = (ys[k1] - ys[k]) / span * elapsed + ys[k]
+        before, after = t <= ts[0], t >= ts[-1]
+        qx = np.where(before, xs[0], np.where(after, xs[-1], qx))
+        qy = np.where(before, ys[0], np.where(after, ys[-1], qy))
+        return qx, qy
+    
+    def _drop_duplicates(self, records: np.ndarray) -> np.ndarray:
+        """
+        Remove repeated reports of the same conflict.
+        
+        A crossing at a shared waypoint is found once for every pair of segments
+        that meet there; keep the first record for each location and time.
+        """
+        if len(records) < 2:
+            return records
+        seen = set()
+        keep = []
+        for k, key in enumerate(zip(records['ix'].round(6).tolist(),
+                                    records['iy'].round(6).tolist(),
+                                    records['t'].round(3).tolist())):
+            if key not in seen:
+                seen.add(key)
+                keep.append(k)
+        return records[keep] if len(keep) < len(records) else records
+    
+    def _create_conflict(self, mission1: Mission, mission2: Mission,
+                         point: Tuple[float, float], time: datetime, distance: float) -> Conflict:
+        """Create a Conflict record for a pair of missions."""
+        return Conflict(
+            location=point,
+            time=time,
+            primary_drone=mission1.drone_id,
+            conflicting_drone=mission2.drone_id,
+            distance=distance
+        )
+    
+    def _temporal_overlap_mask(self, mission1: Mission, mission2: Mission) -> np.ndarray:
+        """
+        Check which segment pairs of two missions have overlapping time windows.
+        
+        Returns:
+            Boolean array of shape (N1-1, N2-1), True where segment i of mission1
+            and segment j of mission2 overlap in time
+        """
+        ts1 = mission1.ts_epoch
+        ts2 = mission2.ts_epoch
+        return (ts2[None, :-1] <= ts1[1:, None]) & (ts1[:-1, None] <= ts2[None, 1:])
+    
+    def _find_intersections(self, mission1: Mission, mission2: Mission,
+                            candidates: Optional[np.ndarray] = None) -> Tuple[np.ndarray, ...]:
+        """
+        Find intersection points between every segment of two missions at once.
+        
+        Segment i of mission1 runs from waypoint i to i + 1. All (i, j) segment
+        pairs are solved with NumPy broadcasting instead of a Python double loop.
+        
+        Args:
+            mission1: First mission
+            mission2: Second mission
+            candidates: Optional (N1-1, N2-1) boolean mask restricting which
+                segment pairs are reported
+            
+        Returns:
+            Tuple of (i, j, t, u, x, y) arrays, one entry per intersecting pair
+            in row-major (i, j) order. t and u are the intersection parameters
+            along each segment, (x, y) the intersection point.
+        """
+        x1, y1 = mission1.xs, mission1.ys
+        x2, y2 = mission2.xs, mission2.ys
+        
+        # Segment endpoints as (N1-1, 1) and (1, N2-1) arrays
+        x1s, y1s = x1[:-1, None], y1[:-1, None]
+        x1e, y1e = x1[1:, None], y1[1:, None]
+        x2s, y2s = x2[None, :-1], y2[None, :-1]
+        x2e, y2e = x2[None, 1:], y2[None, 1:]
+        
+        t, u, mask = self._solve_intersections(x1s, y1s, x1e, y1e, x2s, y2s, x2e, y2e)
+        if candidates is not None:
+            mask &= candidates
+        i, j = np.nonzero(mask)
+        t = t[i, j]
+        u = u[i, j]
+        
+        x = x1s[i, 0] + t * (x1e[i, 0] - x1s[i, 0])
+        y = y1s[i, 0] + t * (y1e[i, 0] - y1s[i, 0])
+        
+        return i, j, t, u, x, y
+    
+    def _find_intersections_indexed(self, mission1: Mission, mission2: Mission,
+                                    candidates: Optional[np.ndarray] = None,
+                                    index: Optional['rtree_index.Index'] = None) -> Tuple[np.ndarray, ...]:
+        """
+        Find intersecting segment pairs using an R-tree over mission1's segments.
+        
+        Only segment pairs whose space-time boxes (grown by the safety buffer)
+        overlap are solved exactly. Returns the same arrays, in the same order,
+        as _find_intersections.
+        
+        Args:
+            mission1: First mission
+            mission2: Second mission
+            candidates: Optional (N1-1, N2-1) boolean mask restricting which
+                segment pairs are reported
+            index: mission1's segment index from _segment_index, built here if
+                not given
+        """
+        x1, y1 = mission1.xs, mission1.ys
+        x2, y2 = mission2.xs, mission2.ys
+        
+        if index is None:
+            index = self._segment_index(mission1)
+        with _INDEX_LOCK:
+            pairs = sorted(
+                (i, j)
+                for j, box in enumerate(self._segment_envelopes(x2, y2, mission2.ts_epoch).tolist())
+                for i in index.intersection(box)
+            )
+        i, j = np.array(pairs, dtype=np.intp).reshape(-1, 2).T
+        if candidates is not None:
+            keep = candidates[i, j]
+            i, j = i[keep], j[keep]
+        
+        # Gather endpoints of the candidate pairs only
+        x1s, y1s = x1[i], y1[i]
+        x1e, y1e = x1[i + 1], y1[i + 1]
+        x2s, y2s = x2[j], y2[j]
+        x2e, y2e = x2[j + 1], y2[j + 1]
+        
+        t, u, mask = self._solve_intersections(x1s, y1s, x1e, y1e, x2s, y2s, x2e, y2e)
+        i, j, t, u = i[mask], j[mask], t[mask], u[mask]
+        
+        x = x1s[mask] + t * (x1e[mask] - x1s[mask])
+        y = y1s[mask] + t * (y1e[mask] - y1s[mask])
+        
+        return i, j, t, u, x, y
+    
+    def _segment_index(self, mission: Mission) -> 'rtree_index.Index':
+        """
+        Build a 3D (x, y, time) R-tree over a mission's segments.
+        
+        Built once per check_mission call and queried with the segments of
+        every large mission checked against it.
+        """
+        properties = rtree_index.Property(dimension=3)
+        boxes = self._segment_envelopes(mission.xs, mission.ys, mission.ts_epoch).tolist()
+        return rtree_index.Index(
+            ((i, box, None) for i, box in enumerate(boxes)), properties=properties
+        )
+    
+    def _segment_envelopes(self, xs: np.ndarray, ys: np.ndarray, ts: np.ndarray) -> np.ndarray:
+        """
+        Space-time boxes (minx, miny, mint, maxx, maxy, maxt) of each segment,
+        grown by the safety buffer in x and y.
+        """
+        return np.column_stack([
+            np.minimum(xs[:-1], xs[1:]) - self.safety_buffer,
+            np.minimum(ys[:-1], ys[1:]) - self.safety_buffer,
+            ts[:-1],
+            np.maximum(xs[:-1], xs[1:]) + self.safety_buffer,
+            np.maximum(ys[:-1], ys[1:]) + self.safety_buffer,
+            ts[1:]
+        ])
+    
+    @staticmethod
+    def _solve_intersections(x1s, y1s, x1e, y1e, x2s, y2s, x2e, y2e) -> Tuple[np.ndarray, ...]:
+        """
+        Solve segment intersections elementwise (inputs broadcast together).
+        
+        Returns:
+            Tuple of (t, u, mask) where mask is True for pairs that intersect
+            within both segments
+        """
+        denom = (x1s - x1e) * (y2s - y2e) - (y1s - y1e) * (x2s - x2e)
+        
+        # Parallel segments divide by zero; they are masked out below
+        with np.errstate(divide='ignore', invalid='ignore'):
+            t = ((x1s - x2s) * (y2s - y2e) - (y1s - y2s) * (x2s - x2e)) / denom
+            u = -((x1s - x1e) * (y1s - y2s) - (y1s - y1e) * (x1s - x2s)) / denom
+        
+        mask = (denom != 0) & (t >= 0) & (t <= 1) & (u >= 0) & (u <= 1)
+        return t, u, mask
     
     def _find_intersection(self, 
                          wp1_start: Waypoint, wp1_end: Waypoint,
                          wp2_start: Waypoint, wp2_end: Waypoint) -> Optional[Tuple[float, float]]:
-        """Find intersection point between two line segments."""
-        # Convert waypoints to line segments
-        p1 = np.array([wp1_start.x, wp1_start.y])
-        p2 = np.array([wp1_end.x, wp1_end.y])
-        p3 = np.array([wp2_start.x, wp2_start.y])
-        p4 = np.array([wp2_end.x, wp2_end.y])
+        """Find intersection point between two line segments.
+        
+        Not used by conflict detection; kept as the plain per-segment
+        reference that test_batched_intersections checks the batched
+        _find_intersections against.
+        """
+        # Work on plain floats; NumPy dispatch costs more than the 2D math itself
+        x1, y1 = wp1_start.x, wp1_start.y
+        x2, y2 = wp1_end.x, wp1_end.y
+        x3, y3 = wp2_start.x, wp2_start.y
+        x4, y4 = wp2_end.x, wp2_end.y
         
         # Calculate intersection
-        denominator = (p1[0] - p2[0]) * (p3[1] - p4[1]) - (p1[1] - p2[1]) * (p3[0] - p4[0])
+        denominator = (x1 - x2) * (y3 - y4) - (y1 - y2) * (x3 - x4)
         
         if denominator == 0:  # Lines are parallel
             return None
             
-        t = ((p1[0] - p3[0]) * (p3[1] - p4[1]) - (p1[1] - p3[1]) * (p3[0] - p4[0])) / denominator
-        u = -((p1[0] - p2[0]) * (p1[1] - p3[1]) - (p1[1] - p2[1]) * (p1[0] - p3[0])) / denominator
+        t = ((x1 - x3) * (y3 - y4) - (y1 - y3) * (x3 - x4)) / denominator
+        u = -((x1 - x2) * (y1 - y3) - (y1 - y2) * (x1 - x3)) / denominator
         
         # Check if intersection is within both line segments
         if 0 <= t <= 1 and 0 <= u <= 1:
-            intersection = p1 + t * (p2 - p1)
-            return (float(intersection[0]), float(intersection[1]))
+            return (float(x1 + t * (x2 - x1)), float(y1 + t * (y2 - y1)))
         
         return None
     
-    def _calculate_conflict_time(self,
-                               wp1_start: Waypoint, wp1_end: Waypoint,
-                               wp2_start: Waypoint, wp2_end: Waypoint,
-                               intersection: Tuple[float, float]) -> Optional[datetime]:
-        """Calculate the time at which the conflict occurs."""
-        # Calculate time based on distance along the path
-        total_dist1 = np.sqrt((wp1_end.x - wp1_start.x)**2 + (wp1_end.y - wp1_start.y)**2)
-        dist_to_conflict1 = np.sqrt((intersection[0] - wp1_start.x)**2 + (intersection[1] - wp1_start.y)**2)
-        time_ratio1 = dist_to_conflict1 / total_dist1 if total_dist1 > 0 else 0
-        
-        time_diff1 = (wp1_end.timestamp - wp1_start.timestamp).total_seconds()
-        conflict_time = wp1_start.timestamp + timedelta(seconds=time_ratio1 * time_diff1)
-        
-        return conflict_time
-    
-    def _calculate_distance(self, wp1: Waypoint, wp2: Waypoint, point: Tuple[float, float]) -> float:
-        """Calculate distance between two points."""
-        return np.sqrt((wp1.x - wp2.x)**2 + (wp1.y - wp2.y)**2) 
\ No newline at end of file
+    def _epoch_to_datetime(self, waypoint: Waypoint, epoch: float) -> datetime:
+        """Convert epoch seconds to a datetime relative to a waypoint's timestamp."""
+        return waypoint.timestamp + timedelta(seconds=epoch - waypoint.epoch)
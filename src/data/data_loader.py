@@ -1,10 +1,18 @@
 import json
 from datetime import datetime, timedelta
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Optional, Tuple
 from pathlib import Path
-import random
+from functools import lru_cache
+import warnings
 
-from models.mission import Waypoint, Mission
+import numpy as np
+
+try:
+    import orjson
+except ImportError:  # orjson is optional; fall back to the standard json module
+    orjson = None
+
+from models.mission import Waypoint, Mission, to_epoch
 
 class DataLoader:
     """Handles loading of mission data from different sources."""
@@ -33,9 +41,28 @@ class DataLoader:
                 }
             ]
         }
+        
+        Loaded files are cached on their resolved path and modification time,
+        so reloading an unchanged file skips parsing. Each call returns its
+        own copies of the cached missions, which callers may modify.
         """
-        with open(file_path, 'r') as f:
-            data = json.load(f)
+        path = Path(file_path).resolve()
+        missions = DataLoader._load_cached(str(path), path.stat().st_mtime_ns)
+        return {
+            'primary': missions['primary'].copy(),
+            'others': [mission.copy() for mission in missions['others']]
+        }
+    
+    @staticmethod
+    @lru_cache(maxsize=16)
+    def _load_cached(path: str, mtime_ns: int) -> Dict[str, Mission]:
+        """Parse a mission JSON file; memoized on (path, mtime_ns) by load_from_json."""
+        if orjson is not None:
+            with open(path, 'rb') as f:
+                data = orjson.loads(f.read())
+        else:
+            with open(path, 'r') as f:
+                data = json.load(f)
             
         missions = {}
         
@@ -54,15 +81,24 @@ class DataLoader:
     @staticmethod
     def _create_mission(data: Dict[str, Any]) -> Mission:
         """Create a Mission object from dictionary data."""
-        waypoints = [
-            Waypoint(
+        if data['waypoints'] and all('timestamp' in wp for wp in data['waypoints']):
+            return DataLoader._create_timed_mission(data)
+        
+        # Missions with untimed waypoints go through the validating constructors,
+        # with the timestamps they do have parsed in one batch
+        timestamps, _ = DataLoader._parse_timestamps(
+            [wp['timestamp'] for wp in data['waypoints'] if 'timestamp' in wp]
+        )
+        parsed = iter(timestamps)
+        
+        waypoints = []
+        for wp in data['waypoints']:
+            waypoints.append(Waypoint(
                 x=wp['x'],
                 y=wp['y'],
                 z=wp.get('z'),
-                timestamp=datetime.fromisoformat(wp['timestamp']) if 'timestamp' in wp else None
-            )
-            for wp in data['waypoints']
-        ]
+                timestamp=next(parsed) if 'timestamp' in wp else None
+            ))
         
         return Mission(
             waypoints=waypoints,
@@ -71,6 +107,44 @@ class DataLoader:
             drone_id=data['drone_id']
         )
     
+    @staticmethod
+    def _create_timed_mission(data: Dict[str, Any]) -> Mission:
+        """Create a Mission whose waypoints all have timestamps.
+        
+        The waypoints are parsed column by column and handed to
+        Mission.from_arrays, which validates them in one batched sweep.
+        """
+        raw = data['waypoints']
+        timestamps, epochs = DataLoader._parse_timestamps([wp['timestamp'] for wp in raw])
+        return Mission.from_arrays(
+            [wp['x'] for wp in raw],
+            [wp['y'] for wp in raw],
+            [wp.get('z') for wp in raw],
+            timestamps,
+            drone_id=data['drone_id'],
+            start_time=datetime.fromisoformat(data['start_time']),
+            end_time=datetime.fromisoformat(data['end_time']),
+            ts_epoch=epochs
+        )
+    
+    @staticmethod
+    def _parse_timestamps(values: List[str]) -> Tuple[List[datetime], List[float]]:
+        """Parse ISO 8601 timestamps with a single NumPy call.
+        
+        Returns the datetimes and their epoch seconds. Strings NumPy cannot
+        represent exactly (e.g. with UTC offsets) fall back to
+        datetime.fromisoformat.
+        """
+        try:
+            with warnings.catch_warnings():
+                warnings.simplefilter('error')
+                parsed = np.array(values, dtype='datetime64[us]')
+        except (ValueError, UserWarning, DeprecationWarning):
+            timestamps = [datetime.fromisoformat(value) for value in values]
+            return timestamps, [to_epoch(ts) for ts in timestamps]
+        
+        return parsed.tolist(), (parsed.astype(np.int64) / 1e6).tolist()
+    
     @staticmethod
     def generate_mission_data(
         num_traffic_drones: int = 4,
@@ -79,7 +153,8 @@ class DataLoader:
         min_altitude: float = 10.0,  # Minimum altitude in meters
         max_altitude: float = 100.0,  # Maximum altitude in meters
         mission_duration: timedelta = timedelta(hours=1),
-        time_buffer: timedelta = timedelta(minutes=15)  # Buffer between drone missions
+        time_buffer: timedelta = timedelta(minutes=15),  # Buffer between drone missions
+        seed: Optional[int] = None  # Random seed for reproducible missions
     ) -> Dict[str, Mission]:
         """Generate mission data with configurable parameters.
         
@@ -91,82 +166,41 @@ class DataLoader:
             max_altitude: Maximum altitude in meters
             mission_duration: Duration of each mission
             time_buffer: Minimum time buffer between drone missions
+            seed: Seed for the random generator; None draws fresh missions
             
         Returns:
             Dictionary containing primary mission and other missions
         """
         now = datetime.now()
+        num_drones = num_traffic_drones + 1
         
-        # Generate primary mission
-        primary_mission = DataLoader._generate_drone_mission(
-            drone_id="primary_drone",
-            start_time=now,
-            duration=mission_duration,
-            area_size=area_size,
-            min_altitude=min_altitude,
-            max_altitude=max_altitude,
-            num_waypoints=waypoints_per_drone
-        )
+        # Draw every drone's waypoints at once: (drones, waypoints, (x, y, z))
+        rng = np.random.default_rng(seed)
+        points = np.empty((num_drones, waypoints_per_drone, 3))
+        points[..., :2] = rng.uniform(0, area_size, size=(num_drones, waypoints_per_drone, 2))
+        points[..., 2] = rng.uniform(min_altitude, max_altitude, size=(num_drones, waypoints_per_drone))
+        
+        # Waypoints are evenly spaced in time over each mission (scaling before
+        # dividing keeps the last waypoint exactly at the mission end)
+        offsets = [mission_duration * i / (waypoints_per_drone - 1) for i in range(waypoints_per_drone)]
         
-        # Generate traffic drone missions
-        other_missions = []
-        for i in range(num_traffic_drones):
-            # Stagger start times to avoid all drones starting at once
-            start_time = now + time_buffer * (i + 1)
-            mission = DataLoader._generate_drone_mission(
-                drone_id=f"traffic_drone_{i+1}",
+        missions = []
+        for d, (xs, ys, zs) in enumerate(points.transpose(0, 2, 1).tolist()):
+            # Stagger start times to avoid all drones starting at once; drone 0
+            # is the primary
+            start_time = now + time_buffer * d
+            missions.append(Mission.from_arrays(
+                xs, ys, zs, [start_time + offset for offset in offsets],
+                drone_id="primary_drone" if d == 0 else f"traffic_drone_{d}",
                 start_time=start_time,
-                duration=mission_duration,
-                area_size=area_size,
-                min_altitude=min_altitude,
-                max_altitude=max_altitude,
-                num_waypoints=waypoints_per_drone
-            )
-            other_missions.append(mission)
+                end_time=start_time + mission_duration
+            ))
         
         return {
-            'primary': primary_mission,
-            'others': other_missions
+            'primary': missions[0],
+            'others': missions[1:]
         }
     
-    @staticmethod
-    def _generate_drone_mission(
-        drone_id: str,
-        start_time: datetime,
-        duration: timedelta,
-        area_size: float,
-        min_altitude: float,
-        max_altitude: float,
-        num_waypoints: int
-    ) -> Mission:
-        """Generate a single drone mission with random waypoints."""
-        end_time = start_time + duration
-        time_step = duration / (num_waypoints - 1)
-        
-        waypoints = []
-        for i in range(num_waypoints):
-            # Generate random coordinates within the area
-            x = random.uniform(0, area_size)
-            y = random.uniform(0, area_size)
-            z = random.uniform(min_altitude, max_altitude)
-            
-            # Calculate timestamp for this waypoint
-            timestamp = start_time + time_step * i
-            
-            waypoints.append(Waypoint(
-                x=x,
-                y=y,
-                z=z,
-                timestamp=timestamp
-            ))
-        
-        return Mission(
-            waypoints=waypoints,
-            start_time=start_time,
-            end_time=end_time,
-            drone_id=drone_id
-        )
-    
     @staticmethod
     def create_sample_data() -> Dict[str, Mission]:
         """Create sample mission data for testing."""
@@ -1,14 +1,24 @@
-from dataclasses import dataclass
-from typing import List, Optional
-from datetime import datetime
+from collections.abc import Sequence
+import copy
+from dataclasses import dataclass, field
+from typing import List, Optional, Tuple, Union
+from datetime import datetime, timezone
+import numpy as np
 
-@dataclass
+def to_epoch(timestamp: datetime) -> float:
+    """Convert a timestamp to epoch seconds (naive timestamps are read as UTC)."""
+    if timestamp.tzinfo is None:
+        timestamp = timestamp.replace(tzinfo=timezone.utc)
+    return timestamp.timestamp()
+
+@dataclass(slots=True)
 class Waypoint:
     """Represents a single waypoint in a drone's mission."""
     x: float  # x-coordinate
     y: float  # y-coordinate
     z: Optional[float] = None  # altitude (optional for 3D)
     timestamp: Optional[datetime] = None  # time at which the drone should reach this waypoint
+    epoch: Optional[float] = field(default=None, init=False, repr=False, compare=False)  # timestamp as epoch seconds, derived from timestamp
 
     def __post_init__(self):
         """Validate waypoint coordinates."""
@@ -16,14 +26,77 @@ class Waypoint:
             raise ValueError("Coordinates cannot be negative")
         if self.z is not None and self.z < 0:
             raise ValueError("Altitude cannot be negative")
+        self.epoch = to_epoch(self.timestamp) if self.timestamp is not None else None
+
+    @classmethod
+    def _unchecked(cls, x: float, y: float, z: Optional[float],
+                   timestamp: Optional[datetime], epoch: Optional[float]) -> 'Waypoint':
+        """Create a waypoint from trusted values without running validation.
+        
+        epoch must be timestamp as epoch seconds (None if there is no timestamp).
+        """
+        waypoint = object.__new__(cls)
+        waypoint.x = x
+        waypoint.y = y
+        waypoint.z = z
+        waypoint.timestamp = timestamp
+        waypoint.epoch = epoch
+        return waypoint
 
-@dataclass
+class _WaypointView(Sequence):
+    """Read-only list of waypoints built on demand from parallel waypoint lists.
+    
+    Missions created from arrays keep their data as arrays; Waypoint objects
+    are only created for the call sites that index or iterate them.
+    """
+    __slots__ = ('_xs', '_ys', '_zs', '_timestamps', '_epochs')
+    
+    def __init__(self, xs: List[float], ys: List[float], zs: List[Optional[float]],
+                 timestamps: List[datetime], epochs: List[float]):
+        self._xs = xs
+        self._ys = ys
+        self._zs = zs
+        self._timestamps = timestamps
+        self._epochs = epochs
+    
+    def __len__(self) -> int:
+        return len(self._xs)
+    
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return [self[i] for i in range(*index.indices(len(self)))]
+        return Waypoint._unchecked(self._xs[index], self._ys[index], self._zs[index],
+                                   self._timestamps[index], self._epochs[index])
+    
+    def __iter__(self):
+        return map(Waypoint._unchecked, self._xs, self._ys, self._zs, self._timestamps, self._epochs)
+    
+    def __eq__(self, other) -> bool:
+        if isinstance(other, (Sequence, list)) and not isinstance(other, str):
+            return len(self) == len(other) and all(a == b for a, b in zip(self, other))
+        return NotImplemented
+    
+    def __repr__(self) -> str:
+        return repr(list(self))
+
+@dataclass(slots=True)
 class Mission:
     """Represents a complete drone mission with waypoints and time window."""
-    waypoints: List[Waypoint]
+    waypoints: Union[List[Waypoint], _WaypointView]
     start_time: datetime
     end_time: datetime
     drone_id: str  # Unique identifier for the drone
+    
+    # Derived caches, filled in by _cache_arrays
+    xs: np.ndarray = field(init=False, repr=False, compare=False)  # waypoint x-coordinates
+    ys: np.ndarray = field(init=False, repr=False, compare=False)  # waypoint y-coordinates
+    zs: np.ndarray = field(init=False, repr=False, compare=False)  # waypoint altitudes (NaN if missing)
+    xyz: np.ndarray = field(init=False, repr=False, compare=False)  # waypoint positions as an (N, 3) array
+    ts_epoch: np.ndarray = field(init=False, repr=False, compare=False)  # waypoint times in epoch seconds
+    seg_len: np.ndarray = field(init=False, repr=False, compare=False)  # x-y length of each segment
+    bbox: Tuple[float, float, float, float] = field(init=False, repr=False, compare=False)  # (xmin, xmax, ymin, ymax)
+    tbox: Tuple[float, float] = field(init=False, repr=False, compare=False)  # (tmin, tmax) in epoch seconds
+    _time_strs: Optional[List[str]] = field(init=False, repr=False, compare=False)  # see time_strs
 
     def __post_init__(self):
         """Validate mission parameters."""
@@ -32,12 +105,151 @@ class Mission:
         if self.end_time <= self.start_time:
             raise ValueError("End time must be after start time")
         
-        # Sort waypoints by timestamp if they have timestamps
+        # Sort waypoints by timestamp if they have timestamps (and are out of order)
         if all(wp.timestamp is not None for wp in self.waypoints):
-            self.waypoints.sort(key=lambda wp: wp.timestamp)
+            ts = [wp.timestamp for wp in self.waypoints]
+            if any(ts[i] > ts[i + 1] for i in range(len(ts) - 1)):
+                self.waypoints.sort(key=lambda wp: wp.timestamp)
             
         # Validate waypoint timestamps are within mission window
         for wp in self.waypoints:
             if wp.timestamp is not None:
                 if not (self.start_time <= wp.timestamp <= self.end_time):
-                    raise ValueError("Waypoint timestamp must be within mission time window") 
\ No newline at end of file
+                    raise ValueError("Waypoint timestamp must be within mission time window")
+        
+        n = len(self.waypoints)
+        self._cache_arrays(
+            np.fromiter((wp.x for wp in self.waypoints), dtype=np.float64, count=n),
+            np.fromiter((wp.y for wp in self.waypoints), dtype=np.float64, count=n),
+            np.fromiter(
+                (wp.z if wp.z is not None else np.nan for wp in self.waypoints),
+                dtype=np.float64, count=n
+            ),
+            np.fromiter(
+                (wp.epoch if wp.epoch is not None else np.nan for wp in self.waypoints),
+                dtype=np.float64, count=n
+            )
+        )
+
+    def _cache_arrays(self, xs: np.ndarray, ys: np.ndarray, zs: np.ndarray, ts_epoch: np.ndarray):
+        """Cache waypoint data as parallel arrays (SoA) plus derived per-mission values.
+        
+        Vectorized and compiled code reads these arrays and never walks the
+        Waypoint objects. Missing altitudes and timestamps are stored as NaN.
+        """
+        self.xs = xs
+        self.ys = ys
+        self.zs = zs
+        self.xyz = np.column_stack([xs, ys, zs])
+        self.ts_epoch = ts_epoch
+        self._time_strs = None
+        
+        # Segment lengths in the x-y plane, reused by conflict time interpolation
+        self.seg_len = np.hypot(np.diff(xs), np.diff(ys))
+        
+        # Overall extent of the mission in space (xmin, xmax, ymin, ymax) and time
+        self.bbox = (float(xs.min()), float(xs.max()), float(ys.min()), float(ys.max()))
+        self.tbox = (float(ts_epoch.min()), float(ts_epoch.max()))
+
+    def copy(self) -> 'Mission':
+        """Copy of the mission that shares no mutable state with it.
+        
+        Waypoint objects and cached arrays are copied; the read-only waypoint
+        view of a mission built from arrays is shared.
+        """
+        mission = copy.copy(self)
+        if not isinstance(self.waypoints, _WaypointView):
+            mission.waypoints = [copy.copy(wp) for wp in self.waypoints]
+        for name in ('xs', 'ys', 'zs', 'xyz', 'ts_epoch', 'seg_len'):
+            setattr(mission, name, getattr(self, name).copy())
+        if self._time_strs is not None:
+            mission._time_strs = list(self._time_strs)
+        return mission
+    
+    @property
+    def time_strs(self) -> List[str]:
+        """Waypoint times formatted as HH:MM:SS (empty if missing), computed on first use."""
+        if self._time_strs is None:
+            self._time_strs = [
+                wp.timestamp.strftime('%H:%M:%S') if wp.timestamp is not None else ''
+                for wp in self.waypoints
+            ]
+        return self._time_strs
+    
+    @classmethod
+    def from_arrays(cls, xs, ys, zs, timestamps: List[datetime], drone_id: str,
+                    start_time: datetime, end_time: datetime,
+                    ts_epoch: Optional[List[float]] = None) -> 'Mission':
+        """Create a mission from parallel waypoint arrays.
+        
+        Validates the same rules as the Waypoint and Mission constructors in
+        one batched NumPy sweep and sorts the waypoints by time if needed.
+        The waypoints are kept as arrays; mission.waypoints builds Waypoint
+        objects only when accessed.
+        
+        Args:
+            xs: Waypoint x-coordinates
+            ys: Waypoint y-coordinates
+            zs: Waypoint altitudes (None entries, or None for all, if missing)
+            timestamps: Time at which the drone reaches each waypoint
+            drone_id: Unique identifier for the drone
+            start_time: Start of the mission window
+            end_time: End of the mission window
+            ts_epoch: Timestamps as epoch seconds, computed if not given
+            
+        Returns:
+            Mission with validated, time-sorted waypoints
+        """
+        xs, ys = list(xs), list(ys)
+        zs = [None] * len(xs) if zs is None else list(zs)
+        timestamps = list(timestamps)
+        epochs = [to_epoch(ts) for ts in timestamps] if ts_epoch is None else list(ts_epoch)
+        
+        if not xs:
+            raise ValueError("Mission must have at least one waypoint")
+        x_arr = np.asarray(xs, dtype=np.float64)
+        y_arr = np.asarray(ys, dtype=np.float64)
+        z_arr = np.array([z if z is not None else np.nan for z in zs], dtype=np.float64)
+        ts = np.asarray(epochs, dtype=np.float64)
+        
+        if (x_arr < 0).any() or (y_arr < 0).any():
+            raise ValueError("Coordinates cannot be negative")
+        if (z_arr < 0).any():
+            raise ValueError("Altitude cannot be negative")
+        if end_time <= start_time:
+            raise ValueError("End time must be after start time")
+        
+        # Sort waypoints by timestamp if they are out of order
+        if (np.diff(ts) < 0).any():
+            order = np.argsort(ts, kind='stable').tolist()
+            xs, ys, zs = [xs[i] for i in order], [ys[i] for i in order], [zs[i] for i in order]
+            timestamps, epochs = [timestamps[i] for i in order], [epochs[i] for i in order]
+            ts = ts[order]
+        
+        if (ts < to_epoch(start_time)).any() or (ts > to_epoch(end_time)).any():
+            raise ValueError("Waypoint timestamp must be within mission time window")
+        
+        return cls._unchecked(xs, ys, zs, timestamps, epochs, drone_id, start_time, end_time)
+    
+    @classmethod
+    def _unchecked(cls, xs: List[float], ys: List[float], zs: List[Optional[float]],
+                   timestamps: List[datetime], ts_epoch: List[float],
+                   drone_id: str, start_time: datetime, end_time: datetime) -> 'Mission':
+        """Create a mission from trusted parallel waypoint lists without validation.
+        
+        The caller must already have checked everything __post_init__ would
+        (non-negative coordinates, time-sorted waypoints inside the mission
+        window); see from_arrays.
+        """
+        mission = object.__new__(cls)
+        mission.waypoints = _WaypointView(xs, ys, zs, timestamps, ts_epoch)
+        mission.start_time = start_time
+        mission.end_time = end_time
+        mission.drone_id = drone_id
+        mission._cache_arrays(
+            np.asarray(xs, dtype=np.float64),
+            np.asarray(ys, dtype=np.float64),
+            np.array([z if z is not None else np.nan for z in zs], dtype=np.float64),
+            np.asarray(ts_epoch, dtype=np.float64)
+        )
+        return mission
@@ -1,12 +1,21 @@
 from data.data_loader import DataLoader
-from conflict.conflict_detector import ConflictDetector
+from conflict.conflict_detector import ConflictDetector, rtree_index
+from conflict import _kernels, _cuda_kernel
+from models.mission import Mission, Waypoint
+from datetime import datetime, timedelta
 import json
 import os
 
+import numpy as np
+import pytest
+
+# Repository root, where the scenario JSON files live
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 def test_conflict_detection():
     """Test the conflict detection system with sample data."""
     # Load test scenarios
-    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_scenarios.json')
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
     missions = DataLoader.load_from_json(json_path)
     
     # Initialize conflict detector with 50m safety buffer
@@ -33,7 +42,7 @@ def test_conflict_detection():
 def test_with_different_buffer():
     """Test conflict detection with different safety buffer sizes."""
     # Load test scenarios
-    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_scenarios.json')
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
     missions = DataLoader.load_from_json(json_path)
     
     # Test different buffer sizes
@@ -52,6 +61,241 @@ def test_with_different_buffer():
             print(f"Time: {conflicts[0].time.strftime('%H:%M:%S')}")
             print(f"Distance: {conflicts[0].distance:.2f}m")
 
+def test_batched_intersections():
+    """Test that the batched intersection search matches the per-pair check."""
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
+    missions = DataLoader.load_from_json(json_path)
+    detector = ConflictDetector(safety_buffer=50.0)
+    
+    primary = missions['primary']
+    for other in missions['others']:
+        expected = []
+        for i in range(len(primary.waypoints) - 1):
+            for j in range(len(other.waypoints) - 1):
+                point = detector._find_intersection(
+                    primary.waypoints[i], primary.waypoints[i + 1],
+                    other.waypoints[j], other.waypoints[j + 1]
+                )
+                if point:
+                    expected.append((i, j, point))
+        
+        seg1_idx, seg2_idx, _, _, xs, ys = detector._find_intersections(primary, other)
+        found = [(int(i), int(j), (float(x), float(y)))
+                 for i, j, x, y in zip(seg1_idx, seg2_idx, xs, ys)]
+        
+        print(f"{other.drone_id}: {len(found)} segment intersections")
+        assert found == expected
+
+def test_rtree_pruning():
+    """Test that R-tree candidate pruning finds the same conflicts as brute force."""
+    if rtree_index is None:
+        pytest.skip("rtree not installed")
+    
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
+    missions = DataLoader.load_from_json(json_path)
+    
+    # A zero threshold routes every mission pair through the index
+    brute_force = ConflictDetector(safety_buffer=100.0)
+    indexed = ConflictDetector(safety_buffer=100.0, rtree_threshold=0)
+    assert indexed._use_index(missions['primary'], missions['others'][0])
+    
+    _, expected = brute_force.check_mission(missions['primary'], missions['others'])
+    _, found = indexed.check_mission(missions['primary'], missions['others'])
+    
+    print(f"Brute force: {len(expected)} conflicts, indexed: {len(found)} conflicts")
+    assert found == expected
+    
+    # A primary without segments has no index to build and is checked brute force
+    first = missions['primary'].waypoints[0]
+    single = Mission(
+        waypoints=[first],
+        start_time=missions['primary'].start_time,
+        end_time=missions['primary'].end_time,
+        drone_id="primary"
+    )
+    assert indexed.check_mission(single, missions['others']) == brute_force.check_mission(single, missions['others'])
+
+def test_rtree_single_waypoint_primary():
+    """Test that a primary mission without segments is not routed through the R-tree."""
+    start = datetime(2024, 4, 10, 10, 0)
+    primary = Mission(
+        waypoints=[Waypoint(x=0, y=0, timestamp=start)],
+        start_time=start,
+        end_time=start + timedelta(hours=1),
+        drone_id="primary"
+    )
+    traffic = Mission(
+        waypoints=[Waypoint(x=i, y=(i % 2) * 5, timestamp=start + timedelta(seconds=i))
+                   for i in range(1100)],
+        start_time=start,
+        end_time=start + timedelta(hours=1),
+        drone_id="traffic1"
+    )
+    detector = ConflictDetector(safety_buffer=50.0)
+    
+    assert not detector._use_index(primary, traffic)
+    status, conflicts = detector.check_mission(primary, [traffic])
+    print(f"Status: {status}")
+    assert conflicts == []
+
+def test_compiled_kernel():
+    """Test that the fused kernel finds the same conflicts as the fallback path."""
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
+    missions = DataLoader.load_from_json(json_path)
+    detector = ConflictDetector(safety_buffer=100.0, cache_size=0)
+    
+    numba_available = _kernels.NUMBA_AVAILABLE
+    try:
+        # Without numba the kernel runs as plain Python, which is enough to check it
+        _kernels.NUMBA_AVAILABLE = False
+        _, expected = detector.check_mission(missions['primary'], missions['others'])
+        _kernels.NUMBA_AVAILABLE = True
+        _, found = detector.check_mission(missions['primary'], missions['others'])
+    finally:
+        _kernels.NUMBA_AVAILABLE = numba_available
+    
+    print(f"Fallback path: {len(expected)} conflicts, kernel: {len(found)} conflicts")
+    assert len(found) == len(expected)
+    for a, b in zip(found, expected):
+        assert a.location == b.location
+        assert a.conflicting_drone == b.conflicting_drone
+        assert abs(a.distance - b.distance) < 1e-9
+        assert abs((a.time - b.time).total_seconds()) < 1e-3
+
+def test_scalar_path():
+    """Test that the fused pure-Python pass matches the vectorized NumPy pass."""
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
+    missions = DataLoader.load_from_json(json_path)
+    detector = ConflictDetector(safety_buffer=100.0)
+    
+    primary = missions['primary']
+    for other in missions['others']:
+        scalar = detector._find_conflicts_scalar(primary, other)
+        vectorized = detector._find_conflicts_vectorized(primary, other)
+        
+        print(f"{other.drone_id}: {len(scalar[0])} conflicts")
+        assert list(scalar[0]) == vectorized[0].tolist()
+        assert list(scalar[1]) == vectorized[1].tolist()
+        for a, b in zip(scalar[2:], vectorized[2:]):
+            assert all(abs(x - y) < 1e-6 for x, y in zip(a, b))
+    
+    # At a time shared by two waypoints the drone is at the first of them
+    start = datetime(2024, 4, 10, 10, 0)
+    primary = Mission(
+        waypoints=[
+            Waypoint(x=0, y=100, timestamp=start),
+            Waypoint(x=200, y=100, timestamp=start + timedelta(minutes=10)),
+        ],
+        start_time=start,
+        end_time=start + timedelta(minutes=10),
+        drone_id="primary"
+    )
+    other = Mission(
+        waypoints=[
+            Waypoint(x=100, y=0, timestamp=start + timedelta(minutes=5)),
+            Waypoint(x=100, y=120, timestamp=start + timedelta(minutes=5)),
+            Waypoint(x=100, y=300, timestamp=start + timedelta(minutes=10)),
+        ],
+        start_time=start,
+        end_time=start + timedelta(minutes=10),
+        drone_id="traffic1"
+    )
+    detector = ConflictDetector(safety_buffer=50.0)
+    scalar = detector._find_conflicts_scalar(primary, other)
+    vectorized = detector._find_conflicts_vectorized(primary, other)
+    assert scalar == ([], [], [], [], [], [])
+    assert all(len(column) == 0 for column in vectorized)
+
+def test_batched_missions():
+    """Test that checking all missions in one stacked pass matches checking each pair."""
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
+    missions = DataLoader.load_from_json(json_path)
+    detector = ConflictDetector(safety_buffer=100.0)
+    
+    primary = missions['primary']
+    batched = detector._check_missions_batched(primary, missions['others'])
+    for other, found in zip(missions['others'], batched):
+        expected = detector._check_mission_pair(primary, other)
+        
+        print(f"{other.drone_id}: {len(found)} conflicts")
+        assert found['i1'].tolist() == expected['i1'].tolist()
+        assert found['i2'].tolist() == expected['i2'].tolist()
+        for name in ('ix', 'iy', 't', 'dist'):
+            assert all(abs(a - b) < 1e-6 for a, b in zip(found[name], expected[name]))
+    
+    # A drone whose waypoints all share one time is held at its last waypoint
+    # after that time, on every path
+    start = datetime(2024, 4, 10, 10, 0)
+    primary = Mission(
+        waypoints=[
+            Waypoint(x=0, y=100, timestamp=start),
+            Waypoint(x=200, y=100, timestamp=start + timedelta(minutes=10)),
+        ],
+        start_time=start,
+        end_time=start + timedelta(minutes=10),
+        drone_id="primary"
+    )
+    instant = start + timedelta(minutes=2)
+    other = Mission(
+        waypoints=[
+            Waypoint(x=100, y=0, timestamp=instant),
+            Waypoint(x=100, y=200, timestamp=instant),
+            Waypoint(x=100, y=120, timestamp=instant),
+        ],
+        start_time=start,
+        end_time=start + timedelta(minutes=10),
+        drone_id="traffic1"
+    )
+    detector = ConflictDetector(safety_buffer=50.0)
+    found, = detector._check_missions_batched(primary, [other])
+    expected = detector._check_mission_pair(primary, other)
+    assert len(expected) == 1
+    assert found.tolist() == expected.tolist()
+
+def test_result_cache():
+    """Test that repeated checks are answered from the cache, keyed on waypoint data."""
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
+    missions = DataLoader.load_from_json(json_path)
+    detector = ConflictDetector(safety_buffer=100.0, cache_size=1)
+    uncached = ConflictDetector(safety_buffer=100.0, cache_size=0)
+    
+    primary, others = missions['primary'], missions['others']
+    expected = uncached.check_mission(primary, others)
+    assert detector.check_mission(primary, others) == expected
+    assert detector.check_mission(primary, others) == expected
+    assert len(detector._results) == 1
+    
+    # A different scenario replaces the only cache entry
+    assert detector.check_mission(primary, others[:1]) == uncached.check_mission(primary, others[:1])
+    assert len(detector._results) == 1
+    assert len(uncached._results) == 0
+
+def test_cuda_kernel():
+    """Test that the GPU kernel finds the same conflicts as the NumPy batched pass."""
+    if not _cuda_kernel.is_available():
+        pytest.skip("needs numba and a CUDA device")
+    
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
+    missions = DataLoader.load_from_json(json_path)
+    detector = ConflictDetector(safety_buffer=100.0)
+    
+    primary, others = missions['primary'], missions['others']
+    counts = np.array([len(m.xs) for m in others], dtype=np.int64)
+    offsets = np.concatenate([[0], np.cumsum(counts)[:-1]]).astype(np.int64)
+    xw, yw, tw = (np.concatenate([getattr(m, name) for m in others]) for name in ('xs', 'ys', 'ts_epoch'))
+    
+    expected = detector._find_conflicts_stacked(primary, xw, yw, tw, offsets, counts)
+    found = _cuda_kernel.find_conflicts_stacked(
+        primary.xs, primary.ys, primary.ts_epoch, primary.seg_len,
+        xw, yw, tw, offsets, counts, detector.safety_buffer
+    )
+    
+    print(f"NumPy: {len(expected[0])} conflicts, GPU: {len(found[0])} conflicts")
+    for a, b in zip(found[:3], expected[:3]):
+        assert a.tolist() == b.tolist()
+    for a, b in zip(found[3:], expected[3:]):
+        assert np.allclose(a, b)
+
 if __name__ == "__main__":
     print("Testing Conflict Detection System")
     print("=" * 50)
@@ -2,12 +2,15 @@ from data.data_loader import DataLoader
 from visualization.plotter import MissionPlotter
 import os
 
+# Repository root, where the scenario JSON files live
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 def test_conflict_scenarios():
     """Test visualization of conflict scenarios from JSON file."""
     print("\nTesting Conflict Scenarios Visualization...")
     
     # Load mission data from JSON file
-    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_scenarios.json')
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
     missions = DataLoader.load_from_json(json_path)
     
     # Create plotter and visualize
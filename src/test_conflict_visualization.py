@@ -4,10 +4,19 @@ from visualization.plotter import MissionPlotter
 from visualization.plotly_plotter import PlotlyMissionPlotter
 from datetime import datetime
 from models.mission import Mission, Waypoint
-from typing import List, Dict
+from typing import List, Dict, Optional
+from concurrent.futures import ProcessPoolExecutor
 import os
+import sys
 import json
 
+# Repository root, where the scenario JSON files live
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
+# One detector per safety buffer, so repeated checks of a scenario hit the
+# detector's result cache
+_DETECTORS: Dict[float, ConflictDetector] = {}
+
 def check_mission_safety(primary_mission: Mission, other_missions: List[Mission], 
                         safety_buffer: float = 50.0) -> Dict:
     """
@@ -24,32 +33,49 @@ def check_mission_safety(primary_mission: Mission, other_missions: List[Mission]
         - conflicts: List of Conflict objects
         - summary: Human-readable summary of the check
     """
-    detector = ConflictDetector(safety_buffer=safety_buffer)
+    detector = _DETECTORS.get(safety_buffer)
+    if detector is None:
+        detector = _DETECTORS[safety_buffer] = ConflictDetector(safety_buffer=safety_buffer)
     status, conflicts = detector.check_mission(primary_mission, other_missions)
     
+    parts = [f"Mission Safety Check with {safety_buffer}m buffer:\n"]
+    if conflicts:
+        parts.append(f"⚠️ {len(conflicts)} conflicts detected!\n")
+        for i, conflict in enumerate(conflicts, 1):
+            parts.append(f"\nConflict {i}:\n")
+            parts.append(f"  Location: ({conflict.location[0]:.2f}, {conflict.location[1]:.2f})\n")
+            parts.append(f"  Time: {conflict.time.strftime('%H:%M:%S')}\n")
+            parts.append(f"  Distance: {conflict.distance:.2f}m\n")
+            parts.append(f"  Description: {conflict.description}\n")
+    else:
+        parts.append("✅ No conflicts detected. Mission is safe to proceed.")
+    
     result = {
         "status": status,
         "conflicts": conflicts,  # Keep the original Conflict objects
-        "summary": f"Mission Safety Check with {safety_buffer}m buffer:\n"
+        "summary": "".join(parts)
     }
     
-    if conflicts:
-        result["summary"] += f"⚠️ {len(conflicts)} conflicts detected!\n"
-        for i, conflict in enumerate(conflicts, 1):
-            result["summary"] += f"\nConflict {i}:\n"
-            result["summary"] += f"  Location: ({conflict.location[0]:.2f}, {conflict.location[1]:.2f})\n"
-            result["summary"] += f"  Time: {conflict.time.strftime('%H:%M:%S')}\n"
-            result["summary"] += f"  Distance: {conflict.distance:.2f}m\n"
-            result["summary"] += f"  Description: {conflict.description}\n"
-    else:
-        result["summary"] += "✅ No conflicts detected. Mission is safe to proceed."
-    
     return result
 
+# One plotter per process, cleared and reused by the scenarios run from the
+# batch runner below instead of building a new plotter for each one. The
+# pytest tests each build their own plotter so no state passes between them.
+_PLOTTER: Optional[MissionPlotter] = None
+
+def _shared_plotter() -> MissionPlotter:
+    """Return this process's pooled plotter, cleared for a new scenario."""
+    global _PLOTTER
+    if _PLOTTER is None:
+        _PLOTTER = MissionPlotter()
+    else:
+        _PLOTTER.clear()
+    return _PLOTTER
+
 def visualize_conflict_scenario():
     """Visualize a scenario with conflicts."""
     # Load test scenarios
-    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_scenarios.json')
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
     missions = DataLoader.load_from_json(json_path)
     
     # Check mission safety using the query interface
@@ -59,7 +85,7 @@ def visualize_conflict_scenario():
     print(safety_check["summary"])
     
     # Initialize plotter
-    plotter = MissionPlotter()
+    plotter = _shared_plotter()
     
     # Plot static visualization
     plotter.plot_all_missions(missions, safety_check["conflicts"])
@@ -108,7 +134,7 @@ def visualize_conflict_free_scenario():
     print(safety_check["summary"])
     
     # Initialize plotter
-    plotter = MissionPlotter()
+    plotter = _shared_plotter()
     
     # Plot static visualization
     plotter.plot_all_missions(missions)
@@ -156,7 +182,7 @@ def visualize_head_on_collision():
     print(safety_check["summary"])
     
     # Initialize plotter
-    plotter = MissionPlotter()
+    plotter = _shared_plotter()
     
     # Plot static visualization
     plotter.plot_all_missions(missions, safety_check["conflicts"])
@@ -173,7 +199,7 @@ def visualize_head_on_collision():
 def visualize_crossing_collision():
     """Visualize a scenario where drones cross paths at the center."""
     # Load collision scenarios from JSON
-    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_collision_scenarios.json')
+    json_path = os.path.join(REPO_ROOT, 'test_collision_scenarios.json')
     missions = DataLoader.load_from_json(json_path)
     
     # Check mission safety using the query interface
@@ -183,7 +209,7 @@ def visualize_crossing_collision():
     print(safety_check["summary"])
     
     # Initialize plotter
-    plotter = MissionPlotter()
+    plotter = _shared_plotter()
     
     # Plot static visualization
     plotter.plot_all_missions(missions, safety_check["conflicts"])
@@ -200,7 +226,7 @@ def visualize_crossing_collision():
 def visualize_head_on_collision_json():
     """Visualize a head-on collision scenario loaded from JSON."""
     # Load head-on collision scenario from JSON
-    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_head_on_collision.json')
+    json_path = os.path.join(REPO_ROOT, 'test_head_on_collision.json')
     missions = DataLoader.load_from_json(json_path)
     
     # Check mission safety using the query interface
@@ -210,7 +236,7 @@ def visualize_head_on_collision_json():
     print(safety_check["summary"])
     
     # Initialize plotter
-    plotter = MissionPlotter()
+    plotter = _shared_plotter()
     
     # Plot static visualization
     plotter.plot_all_missions(missions, safety_check["conflicts"])
@@ -227,7 +253,7 @@ def visualize_head_on_collision_json():
 def visualize_4d_collision_scenario():
     """Visualize collision scenarios in 4D (3D space + time as color)."""
     # Load collision scenarios from JSON
-    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_collision_scenarios.json')
+    json_path = os.path.join(REPO_ROOT, 'test_collision_scenarios.json')
     missions = DataLoader.load_from_json(json_path)
     
     # Check mission safety using the query interface
@@ -237,7 +263,7 @@ def visualize_4d_collision_scenario():
     print(safety_check["summary"])
     
     # Initialize plotter
-    plotter = MissionPlotter()
+    plotter = _shared_plotter()
     
     # Plot 4D visualization
     plotter.plot_4d_all_missions(missions, safety_check["conflicts"])
@@ -251,7 +277,7 @@ def visualize_4d_collision_scenario():
 def visualize_3d_animation():
     """Visualize a 3D animation of drone missions with varied altitudes."""
     # Load 3D scenarios from JSON
-    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'test_3d_scenarios.json')
+    json_path = os.path.join(REPO_ROOT, 'test_3d_scenarios.json')
     missions = DataLoader.load_from_json(json_path)
     
     # Check mission safety using the query interface
@@ -261,7 +287,7 @@ def visualize_3d_animation():
     print(safety_check["summary"])
     
     # Initialize plotter
-    plotter = MissionPlotter()
+    plotter = _shared_plotter()
     
     # Plot static visualization
     plotter.plot_all_missions(missions, safety_check["conflicts"])
@@ -280,11 +306,13 @@ def test_static_visualization():
     print("Testing static visualization with conflicts...")
     
     # Load test scenarios
-    missions = DataLoader.load_from_json('test_scenarios.json')
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
+    missions = DataLoader.load_from_json(json_path)
     
-    # Check for conflicts
-    detector = ConflictDetector(safety_buffer=50.0)  # 50m safety buffer
-    status, conflicts = detector.check_mission(missions['primary'], missions['others'])
+    # Check for conflicts (50m safety buffer); run in the same process, the
+    # static and animated tests share one detector and its result cache
+    safety_check = check_mission_safety(missions['primary'], missions['others'], safety_buffer=50.0)
+    status, conflicts = safety_check["status"], safety_check["conflicts"]
     
     print(f"Conflict check status: {status}")
     if conflicts:
@@ -307,11 +335,13 @@ def test_animated_visualization():
     print("Testing animated visualization with conflicts...")
     
     # Load test scenarios
-    missions = DataLoader.load_from_json('test_scenarios.json')
+    json_path = os.path.join(REPO_ROOT, 'test_scenarios.json')
+    missions = DataLoader.load_from_json(json_path)
     
-    # Check for conflicts
-    detector = ConflictDetector(safety_buffer=50.0)  # 50m safety buffer
-    status, conflicts = detector.check_mission(missions['primary'], missions['others'])
+    # Check for conflicts (50m safety buffer); run in the same process, the
+    # static and animated tests share one detector and its result cache
+    safety_check = check_mission_safety(missions['primary'], missions['others'], safety_buffer=50.0)
+    status, conflicts = safety_check["status"], safety_check["conflicts"]
     
     print(f"Conflict check status: {status}")
     if conflicts:
@@ -329,13 +359,52 @@ def test_animated_visualization():
     plotter.save_animation('animation.gif', fps=10)
     print("Animation saved as 'animation.gif'")
 
+def _run_scenarios(scenarios):
+    """
+    Run visualization scenarios in order in a worker process with a non-GUI backend.
+    
+    Returns:
+        List of (scenario name, error) for the scenarios that raised
+    """
+    import matplotlib
+    matplotlib.use('Agg')
+    failures = []
+    for scenario in scenarios:
+        try:
+            scenario()
+        except Exception as error:
+            failures.append((scenario.__name__, repr(error)))
+    return failures
+
 if __name__ == "__main__":
     print("Starting visualization tests...")
     
-    # Test static visualization with conflicts
-    test_static_visualization()
-    
-    # Test animated visualization with conflicts
-    test_animated_visualization()
-    
-    print("Visualization tests completed.") 
\ No newline at end of file
+    # Scenarios on the same data run in one worker, in order, so later ones
+    # get the earlier safety checks from the detector cache; the groups
+    # share no state and write separate files, so they run in parallel
+    # worker processes (their printed output may interleave)
+    groups = [
+        (test_static_visualization, test_animated_visualization, visualize_conflict_scenario),
+        (visualize_conflict_free_scenario,),
+        (visualize_head_on_collision,),
+        (visualize_crossing_collision, visualize_4d_collision_scenario),
+        (visualize_head_on_collision_json,),
+        (visualize_3d_animation,),
+    ]
+    with ProcessPoolExecutor(max_workers=os.cpu_count()) as executor:
+        futures = [(group, executor.submit(_run_scenarios, group)) for group in groups]
+    
+    # Report every failure without hiding the scenarios that succeeded, and
+    # exit non-zero if there were any
+    failures = []
+    for group, future in futures:
+        if future.exception() is not None:
+            failures += [(scenario.__name__, repr(future.exception())) for scenario in group]
+        else:
+            failures += future.result()
+    for name, error in failures:
+        print(f"{name} failed: {error}")
+    
+    print("Visualization tests completed.")
+    if failures:
+        sys.exit(1)
@@ -3,6 +3,9 @@ from models.mission import Mission, Waypoint
 from datetime import datetime, timedelta
 import os
 
+# Repository root, where the scenario JSON files live
+REPO_ROOT = os.path.dirname(os.path.dirname(os.path.abspath(__file__)))
+
 def test_mission_creation():
     """Test creating a mission with waypoints."""
     # Create a simple mission
@@ -48,7 +51,7 @@ def test_sample_data():
 
 def test_json_loading():
     """Test loading mission data from JSON file."""
-    json_path = os.path.join(os.path.dirname(os.path.dirname(__file__)), 'sample_mission.json')
+    json_path = os.path.join(REPO_ROOT, 'sample_mission.json')
     missions = DataLoader.load_from_json(json_path)
     
     print("\nLoading from JSON file:")
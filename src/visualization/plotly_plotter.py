@@ -1,46 +1,144 @@
+from heapq import merge
+import math
 import plotly.graph_objects as go
+from plotly.basedatatypes import BaseTraceType
 import numpy as np
 from typing import Dict, List, Optional
-from models.mission import Mission
+from models.mission import Mission, to_epoch
 from conflict.conflict_detector import Conflict
 from datetime import datetime
+from types import MappingProxyType
+
+# Unit sphere mesh, scaled and shifted to draw each conflict's safety buffer;
+# 24 x 12 vertices look the same as a finer mesh at the buffer's low opacity
+_SPHERE_THETA = np.linspace(0, 2*np.pi, 24)
+_SPHERE_PHI = np.linspace(0, np.pi, 12)
+# Stacked as one (3, theta, phi) array of x, y, z coordinates
+_UNIT_SPHERE = np.stack([
+    np.outer(np.cos(_SPHERE_THETA), np.sin(_SPHERE_PHI)),
+    np.outer(np.sin(_SPHERE_THETA), np.sin(_SPHERE_PHI)),
+    np.outer(np.ones(np.size(_SPHERE_THETA)), np.cos(_SPHERE_PHI))
+])
+
+# The same mesh as (theta * phi, 3) vertices and the two triangles of each
+# grid cell, for drawing many buffers as one Mesh3d (see plot_conflicts)
+_SPHERE_VERTICES = _UNIT_SPHERE.reshape(3, -1).T
+_cell = (np.arange(len(_SPHERE_THETA) - 1)[:, None] * len(_SPHERE_PHI)
+         + np.arange(len(_SPHERE_PHI) - 1)).ravel()
+_SPHERE_TRIANGLES = np.concatenate([
+    np.column_stack([_cell, _cell + len(_SPHERE_PHI), _cell + len(_SPHERE_PHI) + 1]),
+    np.column_stack([_cell, _cell + len(_SPHERE_PHI) + 1, _cell + 1])
+])
+del _cell
+
+# Scenes with at least this many traffic drones draw them as a few shared
+# traces (see plot_traffic); Plotly slows down with the number of traces, not
+# points. Smaller scenes keep one legend entry per drone.
+MERGE_TRAFFIC_MIN_DRONES = 10
+
+# Likewise, scenes with at least this many conflicts draw them as one point
+# trace and one buffer mesh (see plot_conflicts)
+MERGE_CONFLICTS_MIN = 10
+
+# Safety buffers with a radius below this fraction of the scene's extent
+# would draw as a speck under the conflict marker, so they are left out
+MIN_BUFFER_FRACTION = 0.005
+
+# Paths with more waypoints than this are simplified before plotting (see
+# _simplify_path); the first tolerance tried is this fraction of the path's
+# bounding-box diagonal, well below what is visible at the default zoom
+MAX_PATH_POINTS = 2000
+_SIMPLIFY_TOLERANCE = 1e-3
+
+def _simplify_path(xyz: np.ndarray, epsilon: float) -> np.ndarray:
+    """
+    Ramer-Douglas-Peucker simplification of a 3D polyline.
+    
+    Returns the sorted indices of the points to keep: the end points plus
+    every point farther than epsilon from the chord of the run it splits.
+    """
+    keep = np.zeros(len(xyz), dtype=bool)
+    keep[[0, -1]] = True
+    stack = [(0, len(xyz) - 1)]
+    while stack:
+        start, end = stack.pop()
+        if end - start < 2:
+            continue
+        # Distance of the inner points from the chord (or the start point,
+        # when the chord has no length)
+        chord = xyz[end] - xyz[start]
+        offsets = xyz[start + 1:end] - xyz[start]
+        length = np.linalg.norm(chord)
+        if length > 0:
+            distances = np.linalg.norm(np.cross(offsets, chord), axis=1) / length
+        else:
+            distances = np.linalg.norm(offsets, axis=1)
+        k = int(np.argmax(distances))
+        if distances[k] > epsilon:
+            split = start + 1 + k
+            keep[split] = True
+            stack.append((start, split))
+            stack.append((split, end))
+    return np.flatnonzero(keep)
+
+# Slider steps of create_animation differ only in their frame name and
+# label; all of them share this template and one animation options dict
+_STEP_OPTIONS = {'mode': 'immediate', 'frame': {'duration': 0, 'redraw': True}}
+_STEP_TEMPLATE = {'method': 'animate'}
+
+# Color of each known drone; other drones are drawn gray. Read-only; each
+# plotter starts from its own copy.
+_COLORS = MappingProxyType({
+    'primary': 'red',
+    'traffic1': 'blue',
+    'traffic2': 'green',
+    'traffic3': 'purple',
+    'traffic4': 'orange'
+})
 
 class PlotlyMissionPlotter:
     """Handles 3D visualization of drone missions using Plotly."""
     
     def __init__(self):
         self.fig = go.Figure()
-        self.colors = {
-            'primary': 'red',
-            'traffic1': 'blue',
-            'traffic2': 'green',
-            'traffic3': 'purple',
-            'traffic4': 'orange'
-        }
+        self.colors = dict(_COLORS)
+        self.scene_extent = None  # largest x/y/z span of the plotted missions, set by plot_all_missions
     
-    def plot_mission(self, mission: Mission, color: str, show_trail: bool = True):
-        """Plot a single mission's waypoints and path."""
-        x = [wp.x for wp in mission.waypoints]
-        y = [wp.y for wp in mission.waypoints]
-        z = [wp.z for wp in mission.waypoints]
-        times = [wp.timestamp.strftime('%H:%M:%S') for wp in mission.waypoints]
+    def plot_mission(self, mission: Mission, color: str, show_trail: bool = True,
+                     max_points: int = MAX_PATH_POINTS) -> List[BaseTraceType]:
+        """Build the traces for a single mission's waypoints and path.
+        
+        Paths with more than max_points waypoints are simplified until they
+        fit, dropping the waypoints that barely change the drawn path.
+        """
+        # Column views of the cached position array; Plotly takes them as is
+        x, y, z = mission.xyz.T
+        times = mission.time_strs
+        
+        if len(x) > max_points:
+            # Missing altitudes are simplified as 0 and drawn as missing
+            xyz = np.nan_to_num(mission.xyz)
+            epsilon = _SIMPLIFY_TOLERANCE * np.linalg.norm(xyz.max(axis=0) - xyz.min(axis=0))
+            keep = _simplify_path(xyz, epsilon)
+            while len(keep) > max(max_points, 2) and epsilon > 0:
+                epsilon *= 2
+                keep = _simplify_path(xyz, epsilon)
+            x, y, z = mission.xyz[keep].T
+            times = [times[i] for i in keep]
         
-        # Plot path with hover information
-        self.fig.add_trace(go.Scatter3d(
+        # Plot path; lines are skipped when picking hover targets, since the
+        # waypoint markers below carry the same hover information
+        traces = [go.Scatter3d(
             x=x, y=y, z=z,
             mode='lines',
             line=dict(color=color, width=4),
             name=f'{mission.drone_id} Path',
             showlegend=True,
-            hovertemplate='<b>%{text}</b><br>' +
-                        'X: %{x:.1f}<br>' +
-                        'Y: %{y:.1f}<br>' +
-                        'Z: %{z:.1f}<extra></extra>',
-            text=times
-        ))
+            hoverinfo='skip'
+        )]
         
         # Plot waypoints with hover information
-        self.fig.add_trace(go.Scatter3d(
+        traces.append(go.Scatter3d(
             x=x, y=y, z=z,
             mode='markers+text',
             marker=dict(
@@ -58,30 +156,88 @@ class PlotlyMissionPlotter:
                         'Z: %{z:.1f}<extra></extra>'
         ))
         
+        if show_trail and len(x) > 1:
+            # Add trailing effect; the growing prefixes of a static trail
+            # overlap into the full path, so one trace draws it
+            traces.append(go.Scatter3d(
+                x=x, y=y, z=z,
+                mode='lines',
+                line=dict(color=color, width=2, dash='dot'),
+                name=f'{mission.drone_id} Trail',
+                showlegend=False,
+                hoverinfo='skip'
+            ))
+        return traces
+    
+    def plot_traffic(self, missions: List[Mission], show_trail: bool = True) -> List[BaseTraceType]:
+        """
+        Build shared traces for several traffic missions.
+        
+        All paths go into one line trace, broken between drones by NaN rows,
+        and all waypoints into one marker trace colored per point, so the
+        trace count does not grow with the number of drones.
+        """
+        color_of = self.colors.get
+        colors = [color_of(mission.drone_id, 'gray') for mission in missions]
+        palette = {color: k for k, color in enumerate(dict.fromkeys(colors))}
+        
+        # Each mission's waypoints followed by a NaN row that breaks the line
+        gap = np.full((1, 3), np.nan)
+        x, y, z = np.concatenate([part for mission in missions for part in (mission.xyz, gap)]).T
+        times = [t for mission in missions for t in (*mission.time_strs, '')]
+        point_colors = [
+            color for mission, color in zip(missions, colors)
+            for color in [color] * (len(mission.xyz) + 1)
+        ]
+        
+        # Line colors can only vary through a colorscale: give each color a band
+        levels = (np.array([palette[color] for color in point_colors]) + 0.5) / len(palette)
+        colorscale = [
+            [edge, color] for color, k in palette.items()
+            for edge in (k / len(palette), (k + 1) / len(palette))
+        ]
+        
+        # Only the waypoint markers take part in hover picking, as in plot_mission
+        traces = [go.Scatter3d(
+            x=x, y=y, z=z,
+            mode='lines',
+            line=dict(color=levels, colorscale=colorscale, cmin=0, cmax=1, width=4),
+            name='Traffic Paths',
+            showlegend=True,
+            hoverinfo='skip'
+        ), go.Scatter3d(
+            x=x, y=y, z=z,
+            mode='markers+text',
+            marker=dict(size=8, color=point_colors, symbol='circle'),
+            text=times,
+            textposition="top center",
+            name='Traffic Waypoints',
+            showlegend=True,
+            hovertemplate='<b>%{text}</b><br>' +
+                        'X: %{x:.1f}<br>' +
+                        'Y: %{y:.1f}<br>' +
+                        'Z: %{z:.1f}<extra></extra>'
+        )]
         if show_trail:
-            # Add trailing effect with hover information
-            for i in range(1, len(x)):
-                self.fig.add_trace(go.Scatter3d(
-                    x=x[:i+1], y=y[:i+1], z=z[:i+1],
-                    mode='lines',
-                    line=dict(color=color, width=2, dash='dot'),
-                    name=f'{mission.drone_id} Trail',
-                    showlegend=False,
-                    hovertemplate='<b>%{text}</b><br>' +
-                                'X: %{x:.1f}<br>' +
-                                'Y: %{y:.1f}<br>' +
-                                'Z: %{z:.1f}<extra></extra>',
-                    text=times[:i+1]
-                ))
+            traces.append(go.Scatter3d(
+                x=x, y=y, z=z,
+                mode='lines',
+                line=dict(color=levels, colorscale=colorscale, cmin=0, cmax=1, width=2, dash='dot'),
+                name='Traffic Trail',
+                showlegend=False,
+                hoverinfo='skip'
+            ))
+        return traces
     
-    def plot_conflict(self, conflict: Conflict):
-        """Plot a conflict point and its safety buffer."""
+    def plot_conflict(self, conflict: Conflict) -> List[BaseTraceType]:
+        """Build the traces for a conflict point and its safety buffer."""
         x = conflict.location[0]
         y = conflict.location[1]
         z = conflict.location[2] if len(conflict.location) > 2 else 0
+        time_str = conflict.time_str
         
         # Plot conflict point with hover information
-        self.fig.add_trace(go.Scatter3d(
+        traces = [go.Scatter3d(
             x=[x], y=[y], z=[z],
             mode='markers',
             marker=dict(
@@ -89,7 +245,7 @@ class PlotlyMissionPlotter:
                 color='black',
                 symbol='diamond'
             ),
-            name=f'Conflict at {conflict.time.strftime("%H:%M:%S")}',
+            name=f'Conflict at {time_str}',
             showlegend=True,
             hovertemplate='<b>Conflict</b><br>' +
                         'Time: %{text}<br>' +
@@ -97,47 +253,121 @@ class PlotlyMissionPlotter:
                         'Y: %{y:.1f}<br>' +
                         'Z: %{z:.1f}<br>' +
                         'Distance: %.1f m<extra></extra>' % conflict.distance,
-            text=[conflict.time.strftime('%H:%M:%S')]
-        ))
+            text=[time_str]
+        )]
         
-        # Create safety buffer sphere
-        theta = np.linspace(0, 2*np.pi, 100)
-        phi = np.linspace(0, np.pi, 100)
-        x_sphere = x + conflict.distance * np.outer(np.cos(theta), np.sin(phi))
-        y_sphere = y + conflict.distance * np.outer(np.sin(theta), np.sin(phi))
-        z_sphere = z + conflict.distance * np.outer(np.ones(np.size(theta)), np.cos(phi))
+        if self._buffer_negligible(conflict.distance):
+            return traces
         
-        self.fig.add_trace(go.Surface(
+        # Create safety buffer sphere; its radius is in the conflict point's
+        # hover text, so the surface is skipped when picking hover targets.
+        # Scale into one new buffer and shift it in place, with no temporaries
+        x_sphere, y_sphere, z_sphere = sphere = np.multiply(_UNIT_SPHERE, conflict.distance)
+        sphere += np.array([x, y, z])[:, None, None]
+        
+        traces.append(go.Surface(
             x=x_sphere, y=y_sphere, z=z_sphere,
             colorscale=[[0, 'rgba(255,0,0,0.1)'], [1, 'rgba(255,0,0,0.1)']],
             showscale=False,
             name='Safety Buffer',
             showlegend=True,
-            hovertemplate='<b>Safety Buffer</b><br>' +
-                        'Radius: %.1f m<extra></extra>' % conflict.distance
+            hoverinfo='skip'
         ))
+        return traces
+    
+    def plot_conflicts(self, conflicts: List[Conflict]) -> List[BaseTraceType]:
+        """
+        Build shared traces for several conflicts.
+        
+        All conflict points go into one marker trace, and all safety buffers
+        into one Mesh3d holding a copy of the unit sphere per conflict, so
+        the trace count does not grow with the number of conflicts.
+        """
+        # Conflict locations as a (K, 3) array, with z = 0 for 2D locations
+        centers = np.array([
+            (c.location[0], c.location[1], c.location[2] if len(c.location) > 2 else 0)
+            for c in conflicts
+        ], dtype=np.float64)
+        distances = np.array([c.distance for c in conflicts], dtype=np.float64)
+        x, y, z = centers.T
+        
+        traces = [go.Scatter3d(
+            x=x, y=y, z=z,
+            mode='markers',
+            marker=dict(size=15, color='black', symbol='diamond'),
+            name='Conflicts',
+            showlegend=True,
+            hovertemplate='<b>Conflict</b><br>' +
+                        'Time: %{text}<br>' +
+                        'X: %{x:.1f}<br>' +
+                        'Y: %{y:.1f}<br>' +
+                        'Z: %{z:.1f}<br>' +
+                        'Distance: %{customdata:.1f} m<extra></extra>',
+            text=[c.time_str for c in conflicts],
+            customdata=distances
+        )]
+        
+        # Safety buffers: the unit sphere scaled and shifted per conflict,
+        # with each copy's triangles offset to index its own vertices
+        visible = ~self._buffer_negligible(distances)
+        if not visible.any():
+            return traces
+        centers, distances = centers[visible], distances[visible]
+        x_mesh, y_mesh, z_mesh = (
+            centers[:, None, :] + distances[:, None, None] * _SPHERE_VERTICES
+        ).reshape(-1, 3).T
+        i, j, k = (
+            _SPHERE_TRIANGLES + len(_SPHERE_VERTICES) * np.arange(len(centers))[:, None, None]
+        ).reshape(-1, 3).T
+        traces.append(go.Mesh3d(
+            x=x_mesh, y=y_mesh, z=z_mesh,
+            i=i, j=j, k=k,
+            color='red',
+            opacity=0.1,
+            name='Safety Buffers',
+            showlegend=True,
+            hoverinfo='skip'
+        ))
+        return traces
+    
+    def _buffer_negligible(self, radius):
+        """Whether a safety buffer radius (or array of radii) is too small to draw in the current scene."""
+        if not self.scene_extent:
+            return np.zeros(np.shape(radius), dtype=bool)
+        return np.asarray(radius) < MIN_BUFFER_FRACTION * self.scene_extent
     
     def plot_all_missions(self, missions: Dict[str, List[Mission]], 
                          conflicts: Optional[List[Conflict]] = None):
-        """Plot all missions and conflicts."""
-        # Clear previous plot
-        self.fig = go.Figure()
+        """Plot all missions and conflicts.
+        
+        The traces are collected first and handed to a new Figure in one
+        call, so Plotly validates them together instead of once per trace.
+        """
+        # Extent of the scene, against which conflict buffers are sized
+        # (missing altitudes count as 0)
+        xyz = np.concatenate([missions['primary'].xyz, *(m.xyz for m in missions['others'])])
+        self.scene_extent = float(np.ptp(np.nan_to_num(xyz), axis=0).max())
         
         # Plot primary mission
-        self.plot_mission(missions['primary'], self.colors['primary'])
+        traces = self.plot_mission(missions['primary'], self.colors['primary'])
         
         # Plot traffic drones
-        for mission in missions['others']:
-            color = self.colors.get(mission.drone_id, 'gray')
-            self.plot_mission(mission, color)
+        if len(missions['others']) >= MERGE_TRAFFIC_MIN_DRONES:
+            traces += self.plot_traffic(missions['others'])
+        else:
+            color_of = self.colors.get
+            for mission in missions['others']:
+                traces += self.plot_mission(mission, color_of(mission.drone_id, 'gray'))
         
         # Plot conflicts if provided
-        if conflicts:
+        if conflicts and len(conflicts) >= MERGE_CONFLICTS_MIN:
+            traces += self.plot_conflicts(conflicts)
+        elif conflicts:
             for conflict in conflicts:
-                self.plot_conflict(conflict)
+                traces += self.plot_conflict(conflict)
         
-        # Update layout with enhanced controls
-        self.fig.update_layout(
+        # Replace the previous plot, with enhanced controls in the layout
+        self.fig = go.Figure(data=traces, layout=dict(
             title='Drone Mission Visualization',
             scene=dict(
                 xaxis_title='X (meters)',
@@ -199,117 +429,147 @@ class PlotlyMissionPlotter:
                     yanchor="top"
                 )
             ]
-        )
+        ))
     
     def show(self):
         """Display the plot."""
         self.fig.show()
     
     def save(self, filename: str):
-        """Save the plot to an HTML file."""
-        self.fig.write_html(filename)
+        """Save the plot to an HTML file.
+        
+        The file loads plotly.js from the CDN instead of inlining ~3 MB of it,
+        and the traces, already validated when the figure was built, are
+        written without a second validation pass.
+        """
+        self.fig.write_html(filename, include_plotlyjs='cdn', validate=False,
+                            full_html=True, auto_play=False,
+                            config={'responsive': True})
     
     def create_animation(self, missions: Dict[str, List[Mission]], 
                         conflicts: Optional[List[Conflict]] = None,
                         filename: str = 'animation.html'):
-        """Create an animated visualization."""
-        # Clear previous plot
-        self.fig = go.Figure()
+        """Create an animated visualization; at least one waypoint must have a timestamp."""
+        # Get all waypoints in order, as (mission, waypoint index, epoch)
+        # triples. Each mission's waypoints are already sorted by time, so a
+        # k-way merge of them replaces a full sort; the mission and waypoint
+        # indices break ties the way a stable sort would. Waypoints without a
+        # timestamp (NaN epoch) are left out. Only the missions' cached arrays
+        # and time strings are read, never Waypoint objects or datetimes.
+        labelled = [('primary', missions['primary'])]
+        labelled += [(mission.drone_id, mission) for mission in missions['others']]
+        timed = [
+            [(t, m, k) for k, t in enumerate(mission.ts_epoch.tolist()) if not math.isnan(t)]
+            for m, (_, mission) in enumerate(labelled)
+        ]
+        all_waypoints = [(m, k, t) for t, m, k in merge(*timed)]
+        if not all_waypoints:
+            raise ValueError("Cannot animate missions without timestamped waypoints")
         
-        # Get all waypoints in order
-        all_waypoints = []
-        for wp in missions['primary'].waypoints:
-            if wp.timestamp:
-                all_waypoints.append(('primary', wp))
+        # Each mission's timed waypoints, in order, as a contiguous (3, N)
+        # coordinate array plus time strings, computed once. Frames take
+        # prefixes of them: array slices are views, and Plotly validates
+        # arrays in one pass instead of element by element as it does lists.
+        # Missions are keyed by index in order of first appearance.
+        mission_paths = {}
+        for m in dict.fromkeys(m for m, _, _ in all_waypoints):
+            mission = labelled[m][1]
+            timed_mask = ~np.isnan(mission.ts_epoch)
+            mission_paths[m] = (
+                np.ascontiguousarray(mission.xyz[timed_mask].T),
+                [t for t, timed in zip(mission.time_strs, timed_mask.tolist()) if timed]
+            )
         
-        for mission in missions['others']:
-            for wp in mission.waypoints:
-                if wp.timestamp:
-                    all_waypoints.append((mission.drone_id, wp))
+        # The animation keeps a fixed set of traces: a path and a current
+        # position per mission, then one trace for all conflicts. They carry
+        # the styling; frames only restyle their coordinates and text.
+        hovertemplate = ('<b>%{text}</b><br>' +
+                         'X: %{x:.1f}<br>' +
+                         'Y: %{y:.1f}<br>' +
+                         'Z: %{z:.1f}<extra></extra>')
+        traces = []
+        color_of = self.colors.get
+        for m in mission_paths:
+            mission_id = labelled[m][0]
+            color = color_of(mission_id, 'gray')
+            
+            # Path with hover information
+            traces.append(go.Scatter3d(
+                mode='lines',
+                line=dict(color=color, width=4),
+                name=f'{mission_id} Path',
+                hovertemplate=hovertemplate
+            ))
+            
+            # Current position with hover information
+            traces.append(go.Scatter3d(
+                mode='markers+text',
+                marker=dict(size=8, color=color, symbol='circle'),
+                textposition="top center",
+                name=f'{mission_id} Position',
+                hovertemplate=hovertemplate
+            ))
         
-        all_waypoints.sort(key=lambda x: x[1].timestamp)
+        if conflicts:
+            traces.append(go.Scatter3d(
+                mode='markers',
+                marker=dict(size=15, color='black', symbol='diamond'),
+                name='Conflicts',
+                hovertemplate='<b>Conflict</b><br>' +
+                            'Time: %{text}<br>' +
+                            'X: %{x:.1f}<br>' +
+                            'Y: %{y:.1f}<br>' +
+                            'Z: %{z:.1f}<br>' +
+                            'Distance: %{customdata:.1f} m<extra></extra>'
+            ))
         
-        # Create frames for animation
+        # Conflict columns in time order; the conflicts that have occurred by
+        # any frame are a prefix of them, found by binary search
+        if conflicts:
+            ordered = sorted(conflicts, key=lambda conflict: conflict.time)
+            conflict_times = np.array([to_epoch(conflict.time) for conflict in ordered])
+            conflict_columns = (
+                [conflict.location[0] for conflict in ordered],
+                [conflict.location[1] for conflict in ordered],
+                [conflict.location[2] if len(conflict.location) > 2 else 0 for conflict in ordered],
+                [conflict.time_str for conflict in ordered],
+                [conflict.distance for conflict in ordered]
+            )
+        
+        # Create frames for animation. Every frame restyles all traces, so
+        # jumping to any frame with the slider shows the full state there.
         frames = []
-        for i in range(len(all_waypoints)):
+        counts = {}
+        for i, (m, _, epoch) in enumerate(all_waypoints):
             frame_data = []
             
-            # Group waypoints by mission up to current frame
-            mission_waypoints = {}
-            for mission_id, wp in all_waypoints[:i+1]:
-                if mission_id not in mission_waypoints:
-                    mission_waypoints[mission_id] = []
-                mission_waypoints[mission_id].append(wp)
+            # Number of waypoints each mission has reached by the current frame
+            counts[m] = counts.get(m, 0) + 1
             
-            # Add traces for each mission
-            for mission_id, waypoints in mission_waypoints.items():
-                x = [wp.x for wp in waypoints]
-                y = [wp.y for wp in waypoints]
-                z = [wp.z for wp in waypoints]
-                times = [wp.timestamp.strftime('%H:%M:%S') for wp in waypoints]
-                
-                color = self.colors.get(mission_id, 'gray')
-                
-                # Add path with hover information
-                frame_data.append(go.Scatter3d(
-                    x=x, y=y, z=z,
-                    mode='lines',
-                    line=dict(color=color, width=4),
-                    name=f'{mission_id} Path',
-                    hovertemplate='<b>%{text}</b><br>' +
-                                'X: %{x:.1f}<br>' +
-                                'Y: %{y:.1f}<br>' +
-                                'Z: %{z:.1f}<extra></extra>',
-                    text=times
-                ))
-                
-                # Add current position with hover information
-                frame_data.append(go.Scatter3d(
-                    x=x[-1:], y=y[-1:], z=z[-1:],
-                    mode='markers+text',
-                    marker=dict(size=8, color=color, symbol='circle'),
-                    text=[times[-1]],
-                    textposition="top center",
-                    name=f'{mission_id} Position',
-                    hovertemplate='<b>%{text}</b><br>' +
-                                'X: %{x:.1f}<br>' +
-                                'Y: %{y:.1f}<br>' +
-                                'Z: %{z:.1f}<extra></extra>'
-                ))
+            # Path so far and current position of each mission (empty until
+            # the mission's first waypoint)
+            for mission, (path, times) in mission_paths.items():
+                k = counts.get(mission, 0)
+                x, y, z = path[:, :k]
+                frame_data.append(go.Scatter3d(x=x, y=y, z=z, text=times[:k]))
+                x, y, z = path[:, max(k - 1, 0):k]
+                frame_data.append(go.Scatter3d(x=x, y=y, z=z, text=times[k-1:k]))
             
-            # Add conflict points if they've occurred
+            # Conflict points that have occurred
             if conflicts:
-                current_time = all_waypoints[i][1].timestamp
-                for conflict in conflicts:
-                    if conflict.time <= current_time:
-                        x = conflict.location[0]
-                        y = conflict.location[1]
-                        z = conflict.location[2] if len(conflict.location) > 2 else 0
-                        
-                        frame_data.append(go.Scatter3d(
-                            x=[x], y=[y], z=[z],
-                            mode='markers',
-                            marker=dict(size=15, color='black', symbol='diamond'),
-                            name=f'Conflict at {conflict.time.strftime("%H:%M:%S")}',
-                            hovertemplate='<b>Conflict</b><br>' +
-                                        'Time: %{text}<br>' +
-                                        'X: %{x:.1f}<br>' +
-                                        'Y: %{y:.1f}<br>' +
-                                        'Z: %{z:.1f}<br>' +
-                                        'Distance: %.1f m<extra></extra>' % conflict.distance,
-                            text=[conflict.time.strftime('%H:%M:%S')]
-                        ))
+                occurred = int(np.searchsorted(conflict_times, epoch, side='right'))
+                x, y, z, times, distances = (values[:occurred] for values in conflict_columns)
+                frame_data.append(go.Scatter3d(x=x, y=y, z=z, text=times, customdata=distances))
             
-            frames.append(go.Frame(data=frame_data, name=f'frame_{i}'))
-        
-        # Add frames to figure
-        self.fig.frames = frames
+            frames.append(go.Frame(data=frame_data, traces=list(range(len(traces))), name=f'frame_{i}'))
         
-        # Set initial data
-        self.fig.add_traces(frames[0].data)
+        # Start from the first frame's state
+        for trace, data in zip(traces, frames[0].data):
+            trace.update(data.to_plotly_json())
         
-        # Update layout with enhanced controls
-        self.fig.update_layout(
+        # Replace the previous plot: the initial traces, all frames, and
+        # enhanced controls in the layout
+        self.fig = go.Figure(data=traces, frames=frames, layout=dict(
             title='Drone Mission Animation',
             scene=dict(
                 xaxis_title='X (meters)',
@@ -372,11 +632,10 @@ class PlotlyMissionPlotter:
                 )
             ],
             sliders=[dict(
-                steps=[dict(
-                    method='animate',
-                    args=[[f'frame_{i}'], dict(mode='immediate', frame=dict(duration=0, redraw=True))],
-                    label=f'Frame {i}'
-                ) for i in range(len(frames))],
+                steps=[
+                    {**_STEP_TEMPLATE, 'args': [[f'frame_{i}'], _STEP_OPTIONS], 'label': f'Frame {i}'}
+                    for i in range(len(frames))
+                ],
                 active=0,
                 transition=dict(duration=0),
                 x=0.1,
@@ -388,7 +647,7 @@ class PlotlyMissionPlotter:
                 ),
                 len=0.9
             )]
-        )
+        ))
         
         # Save animation
-        self.fig.write_html(filename) 
\ No newline at end of file
+        self.save(filename)
\ No newline at end of file
@@ -1,14 +1,101 @@
 import matplotlib.pyplot as plt
 from mpl_toolkits.mplot3d import Axes3D
+from mpl_toolkits.mplot3d.art3d import Line3DCollection
 import numpy as np
 from typing import List, Dict, Optional
-from datetime import datetime
-from models.mission import Mission, Waypoint
+from datetime import datetime, timedelta
+from models.mission import Mission, Waypoint, to_epoch
 from conflict.conflict_detector import Conflict, ConflictDetector
 import matplotlib.colors as mcolors
 from matplotlib.colors import LinearSegmentedColormap
 import matplotlib.animation as animation
 from matplotlib.widgets import Button, Slider
+from pathlib import Path
+import hashlib
+import os
+
+try:
+    import xxhash
+except ImportError:  # xxhash is optional; plot hashes fall back to hashlib
+    xxhash = None
+
+# Unit circle for conflict safety buffers, scaled and shifted per conflict.
+# matplotlib projects every vertex of every circle on each draw; 48 segments
+# look the same as a finer circle at the buffer's low alpha
+_CIRCLE_THETA = np.linspace(0, 2*np.pi, 49)
+_CIRCLE_COS = np.cos(_CIRCLE_THETA)
+_CIRCLE_SIN = np.sin(_CIRCLE_THETA)
+
+# Scenes with at least this many traffic drones draw them with a few shared
+# artists (see plot_traffic); matplotlib slows down with the number of
+# artists, not points. Smaller scenes keep one legend entry per drone.
+MERGE_TRAFFIC_MIN_DRONES = 10
+
+# plot_mission draws at most about this many waypoints of a mission
+MAX_PATH_POINTS = 5000
+
+# create_animation(rotate=True) turns the view only on every this many frames
+ROTATE_EVERY_FRAMES = 5
+
+def _conflict_circles(conflicts: List[Conflict]):
+    """
+    Conflict locations and safety buffer circles, in the z=0 plane.
+    
+    Returns:
+        Tuple of a (K, 2) array of conflict x-y locations and a (K, 49, 3)
+        array holding each conflict's buffer circle as a closed polyline
+    """
+    locs = np.array([c.location[:2] for c in conflicts], dtype=np.float64)
+    dists = np.array([c.distance for c in conflicts], dtype=np.float64)
+    circles = np.zeros((len(conflicts), len(_CIRCLE_THETA), 3))
+    circles[:, :, 0] = locs[:, 0, None] + dists[:, None] * _CIRCLE_COS
+    circles[:, :, 1] = locs[:, 1, None] + dists[:, None] * _CIRCLE_SIN
+    return locs, circles
+
+def _normalize_times(epochs: np.ndarray, start_time: datetime, end_time: datetime) -> np.ndarray:
+    """Map epoch-second times onto [0, 1] across a time window, for color mapping."""
+    start_epoch = to_epoch(start_time)
+    return (epochs - start_epoch) / (to_epoch(end_time) - start_epoch)
+
+# ffmpeg codec for each video format _animation_writer pipes to ffmpeg
+_FFMPEG_CODECS = {
+    '.gif': 'gif',
+    '.mp4': 'h264',
+    '.mkv': 'h264',
+    '.mov': 'h264',
+    '.webm': 'libvpx-vp9',
+}
+
+# Formats Pillow writes as a single animated file
+_PILLOW_FORMATS = {'.gif', '.webp', '.png', '.apng', '.tiff'}
+
+def _animation_writer(filename: str, fps: int) -> Optional[animation.AbstractMovieWriter]:
+    """
+    Movie writer for saving an animation to filename.
+    
+    Video formats are written by piping raw frames to ffmpeg when it is
+    installed, so no per-frame image encoding runs in Python. Formats Pillow
+    handles are otherwise written with Pillow. For anything else None is
+    returned, leaving the choice to matplotlib's default writer.
+    """
+    extension = Path(filename).suffix.lower()
+    codec = _FFMPEG_CODECS.get(extension)
+    if codec is not None and animation.FFMpegWriter.isAvailable():
+        return animation.FFMpegWriter(fps=fps, codec=codec, bitrate=-1)
+    if extension in _PILLOW_FORMATS:
+        return animation.PillowWriter(fps=fps)
+    return None
+
+def _render_disabled() -> bool:
+    """Whether FLYT_NO_RENDER is set to 1, true or yes, turning plot and animation output into no-ops."""
+    return os.environ.get('FLYT_NO_RENDER', '').strip().lower() in ('1', 'true', 'yes')
+
+def _digest(*buffers) -> str:
+    """Hex digest of a rendered canvas buffer, followed by any other buffers."""
+    hasher = xxhash.xxh3_64() if xxhash is not None else hashlib.blake2b(digest_size=16)
+    for buffer in buffers:
+        hasher.update(buffer)
+    return hasher.hexdigest()
 
 class MissionPlotter:
     """Handles 3D visualization of drone missions and conflicts."""
@@ -16,21 +103,17 @@ class MissionPlotter:
     def __init__(self):
         self.fig = plt.figure(figsize=(12, 8))
         self.ax = self.fig.add_subplot(111, projection='3d')
+        self._subplotpars = {k: getattr(self.fig.subplotpars, k)
+                             for k in ('left', 'bottom', 'right', 'top', 'wspace', 'hspace')}
         self.stored_waypoints = None
         self.conflicts = None
+        self.ani = None
         
         # Create a custom colormap for time visualization
         colors = ['blue', 'green', 'yellow', 'red']
         self.time_cmap = LinearSegmentedColormap.from_list('time_cmap', colors)
         
-        # Add control buttons
-        self.ax_play = plt.axes([0.7, 0.05, 0.1, 0.04])
-        self.ax_reset = plt.axes([0.81, 0.05, 0.1, 0.04])
-        self.ax_slider = plt.axes([0.1, 0.05, 0.5, 0.04])
-        
-        self.play_button = Button(self.ax_play, 'Play/Pause')
-        self.reset_button = Button(self.ax_reset, 'Reset View')
-        self.time_slider = Slider(self.ax_slider, 'Time', 0, 1, valinit=0)
+        self._add_controls()
         
         self.is_playing = False
         self.current_frame = 0
@@ -44,63 +127,155 @@ class MissionPlotter:
             'traffic4': 'orange'
         }
     
-    def plot_mission(self, mission: Mission, color: str, show_trail: bool = True):
-        """Plot a single mission's waypoints and path."""
-        x = [wp.x for wp in mission.waypoints]
-        y = [wp.y for wp in mission.waypoints]
-        z = [wp.z for wp in mission.waypoints]
-        times = [wp.timestamp.strftime('%H:%M:%S') for wp in mission.waypoints]
+    def _add_controls(self):
+        """Add the play/pause and reset buttons and the time slider."""
+        self.ax_play = self.fig.add_axes([0.7, 0.05, 0.1, 0.04])
+        self.ax_reset = self.fig.add_axes([0.81, 0.05, 0.1, 0.04])
+        self.ax_slider = self.fig.add_axes([0.1, 0.05, 0.5, 0.04])
+        
+        self.play_button = Button(self.ax_play, 'Play/Pause')
+        self.reset_button = Button(self.ax_reset, 'Reset View')
+        self.time_slider = Slider(self.ax_slider, 'Time', 0, 1, valinit=0)
+    
+    def clear(self):
+        """Reset the plotter so it can draw a new plot.
+        
+        Callers drawing many plots in a row can clear and reuse one plotter.
+        Everything plotted so far is dropped, including the colorbar added by
+        plot_4d_all_missions, and the control widgets are rebuilt so no
+        callbacks or slider state carry over to the next plot.
+        """
+        if self.ani is not None:
+            self.ani.event_source.stop()
+            self.ani = None
+        
+        # save() closes the figure; a closed figure is replaced by a new
+        # pyplot-managed one so the next plot can still be shown
+        if self.fig.canvas.manager is None:
+            self.fig = plt.figure(figsize=(12, 8))
+        else:
+            self.fig.clear()
+            self.fig.subplots_adjust(**self._subplotpars)
+        self.ax = self.fig.add_subplot(111, projection='3d')
+        self._add_controls()
+        
+        self.stored_waypoints = None
+        self.conflicts = None
+        self.is_playing = False
+        self.current_frame = 0
+        self.total_frames = 0
+    
+    def plot_mission(self, mission: Mission, color: str, show_trail: bool = True,
+                     show_labels: bool = False, max_points: int = MAX_PATH_POINTS):
+        """Plot a single mission's waypoints and path.
+        
+        Waypoint time labels are one text artist each, the slowest part of
+        redrawing the plot, so they are only added if show_labels is set.
+        Missions with more than max_points waypoints are drawn from every
+        k-th waypoint (and the last), enough to fill the plot at any size.
+        """
+        # Column views of the cached position array, which matplotlib uses
+        # without copying, and the cached time strings
+        xyz = mission.xyz
+        keep = np.arange(len(xyz))
+        if len(xyz) > max_points:
+            stride = -(-len(xyz) // max_points)
+            keep = np.append(keep[:-1:stride], len(xyz) - 1)
+            xyz = xyz[keep]
+        x, y, z = xyz.T
+        times = mission.time_strs
         
         # Plot path
         self.ax.plot(x, y, z, color=color, linewidth=2, label=f'{mission.drone_id} Path')
         
         # Plot waypoints
-        scatter = self.ax.scatter(x, y, z, color=color, s=50, label=f'{mission.drone_id} Waypoints')
+        self.ax.scatter(x, y, z, color=color, s=50, label=f'{mission.drone_id} Waypoints')
         
         # Add time labels
-        for i, (xi, yi, zi, time) in enumerate(zip(x, y, z, times)):
-            self.ax.text(xi, yi, zi, f'WP{i+1}\n{time}', color=color)
+        if show_labels:
+            labels = [f'WP{i+1}\n{times[i]}' for i in keep.tolist()]
+            for xi, yi, zi, label in zip(x, y, z, labels):
+                self.ax.text(xi, yi, zi, label, color=color)
+        
+        if show_trail and len(x) > 1:
+            # Add trailing effect: one collection of the path's segments,
+            # fading in towards the latest waypoint
+            segments = np.stack([xyz[:-1], xyz[1:]], axis=1)
+            rgba = np.tile(mcolors.to_rgba(color), (len(segments), 1))
+            rgba[:, 3] = np.linspace(0.1, 0.5, len(segments))
+            self.ax.add_collection3d(Line3DCollection(segments, colors=rgba, linestyles=':'))
+    
+    def plot_traffic(self, missions: List[Mission], show_trail: bool = True,
+                     show_labels: bool = False):
+        """
+        Plot several traffic missions with shared artists.
+        
+        All paths go into one line collection, all waypoints into one
+        scatter and all trails into one more collection, each colored per
+        drone, so the artist count does not grow with the number of drones.
+        """
+        colors = np.array([mcolors.to_rgba(self.colors.get(mission.drone_id, 'gray'))
+                           for mission in missions])
+        counts = np.array([len(mission.xyz) for mission in missions])
+        
+        # Plot paths, as the segments of every mission
+        segments = np.concatenate([np.stack([mission.xyz[:-1], mission.xyz[1:]], axis=1)
+                                   for mission in missions])
+        segment_colors = np.repeat(colors, counts - 1, axis=0)
+        if len(segments):  # 3D axes cannot add an empty collection
+            self.ax.add_collection3d(Line3DCollection(segments, colors=segment_colors, linewidths=2,
+                                                      label='Traffic Paths'))
         
-        if show_trail:
-            # Add trailing effect
-            for i in range(1, len(x)):
-                self.ax.plot(x[:i+1], y[:i+1], z[:i+1], color=color, linestyle=':', alpha=0.5)
+        # Plot waypoints
+        xyz = np.concatenate([mission.xyz for mission in missions])
+        self.ax.scatter(xyz[:, 0], xyz[:, 1], xyz[:, 2], c=np.repeat(colors, counts, axis=0), s=50,
+                        label='Traffic Waypoints')
+        
+        # Add time labels
+        if show_labels:
+            for mission, color in zip(missions, colors):
+                labels = [f'WP{i+1}\n{time}' for i, time in enumerate(mission.time_strs)]
+                for (xi, yi, zi), label in zip(mission.xyz, labels):
+                    self.ax.text(xi, yi, zi, label, color=color)
+        
+        if show_trail and len(segments):
+            # Add trailing effect, fading in along each drone's path as in plot_mission
+            segment_colors = segment_colors.copy()
+            segment_colors[:, 3] = np.concatenate([np.linspace(0.1, 0.5, n - 1) for n in counts])
+            self.ax.add_collection3d(Line3DCollection(segments, colors=segment_colors, linestyles=':'))
     
     def plot_conflicts(self, conflicts: List[Conflict]):
-        """Plot conflict points and safety buffers."""
-        self.conflicts = conflicts
+        """Plot conflict points and safety buffers.
         
-        for conflict in conflicts:
-            # Plot conflict point
-            self.ax.scatter(
-                conflict.location[0], 
-                conflict.location[1], 
-                0,
-                color='black', 
-                s=100, 
-                marker='*',
-                label=f'Conflict at {conflict.time.strftime("%H:%M:%S")}'
-            )
-            
-            # Plot safety buffer circle
-            theta = np.linspace(0, 2*np.pi, 100)
-            x = conflict.location[0] + conflict.distance * np.cos(theta)
-            y = conflict.location[1] + conflict.distance * np.sin(theta)
-            z = np.zeros_like(x)
-            
-            self.ax.plot(x, y, z, 'r--', alpha=0.3, label='Safety Buffer')
+        All conflict points are drawn by one scatter and all buffer circles
+        by one collection, however many conflicts there are.
+        """
+        self.conflicts = conflicts
+        if not conflicts:
+            return
+        locs, circles = _conflict_circles(conflicts)
+        
+        # Plot conflict points
+        label = (f'Conflict at {conflicts[0].time_str}'
+                 if len(conflicts) == 1 else 'Conflicts')
+        self.ax.scatter(locs[:, 0], locs[:, 1], 0, color='black', s=100, marker='*', label=label)
+        
+        # Plot safety buffer circles
+        self._add_circles(Line3DCollection(
+            circles, colors='r', linestyles='--', alpha=0.3, label='Safety Buffer'
+        ), circles)
     
-    def plot_all_missions(self, missions: Dict[str, List[Mission]], conflicts: Optional[List[Conflict]] = None):
-        """Plot all missions and conflicts if provided."""
+    def _add_circles(self, collection: Line3DCollection, circles: np.ndarray):
+        """Add a collection of buffer circles, growing the axes limits to fit them like ax.plot would."""
+        self.ax.add_collection3d(collection)
+        self.ax.auto_scale_xyz(circles[..., 0], circles[..., 1], circles[..., 2], had_data=True)
+    
+    def plot_all_missions(self, missions: Dict[str, List[Mission]], conflicts: Optional[List[Conflict]] = None,
+                          show_labels: bool = False):
+        """Plot all missions and conflicts if provided, with waypoint time labels if show_labels is set."""
         # Clear previous plot
         self.ax.clear()
         
-        # Reset limits
-        self.x_min = float('inf')
-        self.x_max = float('-inf')
-        self.y_min = float('inf')
-        self.y_max = float('-inf')
-        
         # Store the waypoints for animation
         self.stored_waypoints = {
             'primary': missions['primary'].waypoints,
@@ -108,12 +283,15 @@ class MissionPlotter:
         }
         
         # Plot primary mission
-        self.plot_mission(missions['primary'], self.colors['primary'])
+        self.plot_mission(missions['primary'], self.colors['primary'], show_labels=show_labels)
         
         # Plot traffic drones
-        for mission in missions['others']:
-            color = self.colors.get(mission.drone_id, 'gray')
-            self.plot_mission(mission, color)
+        if len(missions['others']) >= MERGE_TRAFFIC_MIN_DRONES:
+            self.plot_traffic(missions['others'], show_labels=show_labels)
+        else:
+            for mission in missions['others']:
+                color = self.colors.get(mission.drone_id, 'gray')
+                self.plot_mission(mission, color, show_labels=show_labels)
         
         # Plot conflicts if provided
         if conflicts:
@@ -139,67 +317,158 @@ class MissionPlotter:
     
     def create_animation(self, missions: Dict[str, List[Mission]], 
                         conflicts: Optional[List[Conflict]] = None,
-                        interval: int = 100):
-        """Create an animated visualization."""
-        # Get all waypoints in order
+                        interval: int = 100, rotate: bool = False):
+        """Create an animated visualization.
+        
+        By default the view stays fixed: the static parts (axes, grid, panes)
+        are rendered once and cached, and each frame only redraws the moving
+        artists over that background (blitting). If rotate is set, the view
+        turns with the frame number, stepping every ROTATE_EVERY_FRAMES
+        frames, and the whole figure is redrawn for every frame.
+        """
+        blit = not rotate
+        
+        # Get all waypoints in order, with their missions' cached time strings
         all_waypoints = []
-        for wp in missions['primary'].waypoints:
+        primary = missions['primary']
+        for wp, time_str in zip(primary.waypoints, primary.time_strs):
             if wp.timestamp:
-                all_waypoints.append(('primary', wp))
+                all_waypoints.append(('primary', wp, time_str))
         
         for mission in missions['others']:
-            for wp in mission.waypoints:
+            for wp, time_str in zip(mission.waypoints, mission.time_strs):
                 if wp.timestamp:
-                    all_waypoints.append((mission.drone_id, wp))
+                    all_waypoints.append((mission.drone_id, wp, time_str))
         
-        all_waypoints.sort(key=lambda x: x[1].timestamp)
+        # Sort by time in C: a stable argsort of the epoch seconds
+        epochs = np.fromiter((wp.epoch for _, wp, _ in all_waypoints), dtype=np.float64,
+                             count=len(all_waypoints))
+        all_waypoints = [all_waypoints[i] for i in np.argsort(epochs, kind='stable').tolist()]
         self.total_frames = len(all_waypoints)
         
+        # Artists are created once and only their data changes per frame: a
+        # path line, a position marker and a time label per mission (in order
+        # of first appearance), the occurred conflicts' markers and buffer
+        # circles, and the clock. The axes are scaled to the whole flight up
+        # front. When blitting, the moving artists are marked animated so
+        # they are left out of the cached background.
+        self.ax.clear()
+        self._mission_lines = {}
+        self._mission_scatters = {}
+        self._mission_labels = {}
+        for mission_id in dict.fromkeys(mission_id for mission_id, _, _ in all_waypoints):
+            color = self.colors.get(mission_id, 'gray')
+            self._mission_lines[mission_id], = self.ax.plot([], [], [], color=color, linewidth=2,
+                                                            animated=blit)
+            self._mission_scatters[mission_id] = self.ax.scatter([], [], [], color=color, s=100,
+                                                                 animated=blit)
+            self._mission_labels[mission_id] = self.ax.text(0, 0, 0, '', color=color, animated=blit)
+        self.conflicts = conflicts
+        
+        # Conflict locations and circles in time order, built once; the
+        # conflicts that have occurred by any frame are a prefix of them,
+        # found by binary search on epoch seconds rather than by comparing
+        # datetimes
+        if conflicts:
+            ordered = sorted(conflicts, key=lambda conflict: conflict.time)
+            conflict_epochs = np.array([to_epoch(conflict.time) for conflict in ordered])
+            conflict_locs, conflict_rings = _conflict_circles(ordered)
+            conflict_zs = np.zeros(len(ordered))
+            conflict_markers = self.ax.scatter([], [], [], color='black', s=100, marker='*',
+                                               animated=blit)
+            # Created with every circle (an empty collection cannot be added
+            # to 3D axes); update() trims it to the conflicts seen so far
+            conflict_circles = Line3DCollection(conflict_rings, colors='r', linestyles='--',
+                                                alpha=0.3, animated=blit)
+            self.ax.add_collection3d(conflict_circles)
+        time_text = self.ax.text2D(0.02, 0.95, '', transform=self.ax.transAxes, animated=blit)
+        self.ax.set_title('Drone Mission Animation')
+        
+        moving = [*self._mission_lines.values(), *self._mission_scatters.values(),
+                  *self._mission_labels.values(), time_text]
+        if conflicts:
+            moving += [conflict_markers, conflict_circles]
+        if blit:
+            # The slider moves every frame too; it is blitted along with the
+            # drones instead of triggering a full redraw
+            self.time_slider.drawon = False
+            slider_artists = [artist for artist in (self.time_slider.poly, self.time_slider.valtext,
+                                                    getattr(self.time_slider, '_handle', None))
+                              if artist is not None]
+            for artist in slider_artists:
+                artist.set_animated(True)
+            moving += slider_artists
+            self.ax.view_init(elev=20, azim=45)
+        if all_waypoints:
+            xs = [wp.x for _, wp, _ in all_waypoints]
+            ys = [wp.y for _, wp, _ in all_waypoints]
+            zs = [wp.z or 0 for _, wp, _ in all_waypoints]
+            if conflicts:
+                # Conflicts are drawn in the z=0 plane; keep them in view
+                xs += conflict_rings[:, :, 0].ravel().tolist()
+                ys += conflict_rings[:, :, 1].ravel().tolist()
+                zs.append(0)
+            self.ax.auto_scale_xyz(xs, ys, zs, had_data=False)
+        
+        # Each mission's waypoints as arrays, with the frame index at which
+        # each is reached; a mission's progress at any frame is found by
+        # binary search instead of regrouping all earlier waypoints
+        grouped = {}
+        for i, (mission_id, wp, time_str) in enumerate(all_waypoints):
+            grouped.setdefault(mission_id, []).append((i, wp, time_str))
+        mission_tracks = {
+            mission_id: (
+                np.array([i for i, _, _ in track]),
+                np.array([[wp.x, wp.y, wp.z if wp.z is not None else np.nan] for _, wp, _ in track]).T,
+                [time_str for _, _, time_str in track]
+            )
+            for mission_id, track in grouped.items()
+        }
+        
+        shown_conflicts = -1  # number of conflicts the artists currently show
+        
         def update(frame):
+            nonlocal shown_conflicts
             self.current_frame = frame
             self.time_slider.set_val(frame / self.total_frames)
             
-            # Clear previous plot
-            self.ax.clear()
-            
-            # Group waypoints by mission up to current frame
-            mission_waypoints = {}
-            for mission_id, wp in all_waypoints[:frame+1]:
-                if mission_id not in mission_waypoints:
-                    mission_waypoints[mission_id] = []
-                mission_waypoints[mission_id].append(wp)
-            
-            # Plot each mission's progress
-            for mission_id, waypoints in mission_waypoints.items():
-                x = [wp.x for wp in waypoints]
-                y = [wp.y for wp in waypoints]
-                z = [wp.z for wp in waypoints]
-                times = [wp.timestamp.strftime('%H:%M:%S') for wp in waypoints]
-                
-                color = self.colors.get(mission_id, 'gray')
-                
-                # Plot path
-                self.ax.plot(x, y, z, color=color, linewidth=2)
+            # Move each mission's path and current position (empty until the
+            # mission's first waypoint)
+            for mission_id, line in self._mission_lines.items():
+                frames, xyz, time_strs = mission_tracks[mission_id]
+                k = int(np.searchsorted(frames, frame, side='right'))
+                x, y, z = xyz[:, :k]
+                line.set_data_3d(x, y, z)
+                self._mission_scatters[mission_id]._offsets3d = (x[-1:], y[-1:], z[-1:])
                 
-                # Plot current position
-                self.ax.scatter(x[-1:], y[-1:], z[-1:], color=color, s=100)
-                self.ax.text(x[-1], y[-1], z[-1], times[-1], color=color)
+                # Label the current position with its time on the last frame
+                label = self._mission_labels[mission_id]
+                if k and frame == self.total_frames - 1:
+                    label.set_position((x[-1], y[-1]))
+                    label.set_3d_properties(z[-1], None)
+                    label.set_text(time_strs[k - 1])
+                else:
+                    label.set_text('')
             
-            # Plot conflicts if they've occurred
+            # Show the conflicts that have occurred; most frames add none, and
+            # then the artists are left as they are
             if conflicts:
-                current_time = all_waypoints[frame][1].timestamp
-                for conflict in conflicts:
-                    if conflict.time <= current_time:
-                        self.plot_conflicts([conflict])
+                occurred = int(np.searchsorted(conflict_epochs, all_waypoints[frame][1].epoch, side='right'))
+                if occurred != shown_conflicts:
+                    conflict_markers._offsets3d = (conflict_locs[:occurred, 0], conflict_locs[:occurred, 1],
+                                                   conflict_zs[:occurred])
+                    conflict_circles.set_segments(conflict_rings[:occurred])
+                    shown_conflicts = occurred
             
-            # Update title with current time
-            current_time = all_waypoints[frame][1].timestamp
-            self.ax.set_title(f'Drone Mission Animation\nTime: {current_time.strftime("%H:%M:%S")}')
+            # Update the clock with the current time
+            time_text.set_text(f'Time: {all_waypoints[frame][2]}')
             
-            # Rotate view for better 3D perspective
-            self.ax.view_init(elev=20, azim=(frame % 360))
+            # Rotate view for better 3D perspective; every view change
+            # invalidates the projection of all artists, so only now and then
+            if rotate and frame % ROTATE_EVERY_FRAMES == 0:
+                self.ax.view_init(elev=20, azim=(frame % 360))
             
-            return self.ax
+            return moving
         
         def play_pause(event):
             self.is_playing = not self.is_playing
@@ -217,12 +486,19 @@ class MissionPlotter:
             if frame != self.current_frame:
                 self.current_frame = frame
                 update(frame)
-                self.fig.canvas.draw_idle()
+                if blit:
+                    # Animated artists are skipped by a normal draw
+                    self.fig.canvas.draw()
+                    for artist in moving:
+                        artist.axes.draw_artist(artist)
+                    self.fig.canvas.blit(self.fig.bbox)
+                else:
+                    self.fig.canvas.draw_idle()
         
         # Create animation
         self.ani = animation.FuncAnimation(
             self.fig, update, frames=self.total_frames,
-            interval=interval, blit=False
+            interval=interval, blit=blit
         )
         
         # Connect controls
@@ -234,73 +510,186 @@ class MissionPlotter:
         plt.tight_layout()
         plt.show()
     
+    def plot_mission_animation(self, missions: Dict[str, List[Mission]],
+                               conflicts: Optional[List[Conflict]] = None,
+                               interval: int = 500, save_path: Optional[str] = None):
+        """
+        Animate the drones flying their missions.
+        
+        Paths and conflict markers are drawn once as a static background; each
+        frame only moves the drone markers, their trails and the time label, so
+        the animation can be blitted.
+        
+        Args:
+            missions: Dictionary with the 'primary' mission and 'others' list
+            conflicts: Optional conflicts to mark on the background
+            interval: Delay between frames in milliseconds
+            save_path: If given, save the animation as a GIF here instead of
+                showing it
+            
+        Returns:
+            The FuncAnimation object, or None if rendering is disabled with
+            FLYT_NO_RENDER
+        """
+        if _render_disabled():
+            return None
+        
+        self.ax.clear()
+        all_missions = [missions['primary']] + list(missions['others'])
+        
+        # Static background: faded full paths and conflict markers
+        for mission in all_missions:
+            color = self._mission_color(mission, missions['primary'])
+            self.ax.plot(mission.xs, mission.ys, np.nan_to_num(mission.zs),
+                         color=color, linewidth=1, alpha=0.3, label=f'{mission.drone_id} Path')
+        if conflicts:
+            self.plot_conflicts(conflicts)
+        
+        self.ax.set_xlabel('X (meters)')
+        self.ax.set_ylabel('Y (meters)')
+        self.ax.set_zlabel('Z (meters)')
+        self.ax.set_title('Drone Mission Animation')
+        self.ax.set_box_aspect([1, 1, 1])
+        self.ax.view_init(elev=20, azim=45)
+        self.ax.grid(True)
+        
+        # Moving artists: a trail and a position marker per drone, plus the clock
+        drones = []
+        for mission in all_missions:
+            color = self._mission_color(mission, missions['primary'])
+            trail, = self.ax.plot([], [], [], color=color, linewidth=2, animated=True)
+            marker, = self.ax.plot([], [], [], color=color, marker='o', markersize=8,
+                                   linestyle='', animated=True)
+            drones.append((mission, np.nan_to_num(mission.zs), trail, marker))
+        time_text = self.ax.text2D(0.02, 0.95, '', transform=self.ax.transAxes, animated=True)
+        artists = [artist for _, _, trail, marker in drones for artist in (trail, marker)]
+        artists.append(time_text)
+        
+        # One frame per distinct waypoint time across all missions
+        frame_epochs = np.unique(np.concatenate([m.ts_epoch for m in all_missions]))
+        frame_epochs = frame_epochs[~np.isnan(frame_epochs)]
+        reference = missions['primary'].waypoints[0]
+        self.total_frames = len(frame_epochs)
+        
+        # Clock text per frame, formatted once rather than on every (repeated) frame
+        frame_labels = [
+            f'Time: {(reference.timestamp + timedelta(seconds=float(t) - reference.epoch)).strftime("%H:%M:%S")}'
+            for t in frame_epochs
+        ]
+        
+        def update(frame):
+            t = frame_epochs[frame]
+            for mission, zs, trail, marker in drones:
+                ts = mission.ts_epoch
+                k = np.searchsorted(ts, t, side='right')
+                if k == 0:  # Not airborne yet
+                    trail.set_data_3d([], [], [])
+                    marker.set_data_3d([], [], [])
+                    continue
+                x = np.interp(t, ts, mission.xs)
+                y = np.interp(t, ts, mission.ys)
+                z = np.interp(t, ts, zs)
+                trail.set_data_3d(np.append(mission.xs[:k], x), np.append(mission.ys[:k], y),
+                                  np.append(zs[:k], z))
+                marker.set_data_3d([x], [y], [z])
+            
+            time_text.set_text(frame_labels[frame])
+            return artists
+        
+        self.ani = animation.FuncAnimation(
+            self.fig, update, frames=self.total_frames,
+            interval=interval, blit=True
+        )
+        
+        if save_path:
+            fps = max(1, round(1000 / interval))
+            self.ani.save(save_path, writer=_animation_writer(save_path, fps))
+        else:
+            plt.show()
+        return self.ani
+    
+    def _mission_color(self, mission: Mission, primary: Mission) -> str:
+        """Plot color of a mission's drone."""
+        if mission is primary:
+            return self.colors['primary']
+        return self.colors.get(mission.drone_id, 'gray')
+    
     def save_animation(self, filename: str, fps: int = 10):
-        """Save the animation to a file."""
-        if self.ani:
-            self.ani.save(filename, writer='pillow', fps=fps)
+        """Save the animation to a file, with ffmpeg if it is installed."""
+        if self.ani and not _render_disabled():
+            self.ani.save(filename, writer=_animation_writer(filename, fps))
     
     def save_plot(self, filename: str):
         """Save the current plot to a file."""
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-    
-    def _update_plot_limits(self, x: List[float], y: List[float]):
-        """Update plot limits based on coordinates."""
-        if not hasattr(self, 'x_min'):
-            self.x_min = min(x)
-            self.x_max = max(x)
-            self.y_min = min(y)
-            self.y_max = max(y)
-        else:
-            self.x_min = min(self.x_min, min(x))
-            self.x_max = max(self.x_max, max(x))
-            self.y_min = min(self.y_min, min(y))
-            self.y_max = max(self.y_max, max(y))
-        
-        # Add padding
-        padding = 50
-        self.ax.set_xlim(self.x_min - padding, self.x_max + padding)
-        self.ax.set_ylim(self.y_min - padding, self.y_max + padding)
+        if _render_disabled():
+            return
+        self.fig.savefig(filename, dpi=300, bbox_inches='tight')
     
     def show(self):
         """Display the plot."""
         plt.tight_layout()
         plt.show()
     
-    def save(self, filename: str):
-        """Save the plot to a file."""
-        plt.tight_layout()
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close()
+    def save(self, filename: str, hash_file: bool = False):
+        """Save the plot to a file.
+        
+        With hash_file set, the rendered canvas and the save options are
+        hashed before anything is encoded, and the hash kept in a '.hash'
+        sidecar file; if the file already holds an identical plot, the PNG
+        encoding and write are skipped. Nothing is written if FLYT_NO_RENDER
+        is set.
+        """
+        if _render_disabled():
+            plt.close(self.fig)
+            return
+        
+        self.fig.tight_layout()
+        savefig_kwargs = {'dpi': 300, 'bbox_inches': 'tight'}
+        if hash_file:
+            self.fig.canvas.draw()
+            options = repr((self.fig.canvas.get_width_height(), sorted(savefig_kwargs.items())))
+            digest = _digest(self.fig.canvas.buffer_rgba(), options.encode())
+            hash_path = Path(f'{filename}.hash')
+            if Path(filename).exists() and hash_path.exists() and hash_path.read_text() == digest:
+                plt.close(self.fig)
+                return
+        
+        self.fig.savefig(filename, **savefig_kwargs)
+        if hash_file:
+            hash_path.write_text(digest)
+        plt.close(self.fig)
     
     def plot_4d_mission(self, mission: Mission, start_time: datetime, end_time: datetime, 
-                       color: str = 'blue', label: str = None):
-        """Plot a mission in 4D (3D space + time as color)."""
-        # Extract coordinates and timestamps
+                       color: str = 'blue', label: str = None, show_labels: bool = False):
+        """Plot a mission in 4D (3D space + time as color), with waypoint time labels if show_labels is set."""
+        # Extract coordinates
         x = [wp.x for wp in mission.waypoints]
         y = [wp.y for wp in mission.waypoints]
         z = [wp.z for wp in mission.waypoints]
-        times = [wp.timestamp for wp in mission.waypoints]
         
-        # Normalize timestamps to [0,1] for color mapping
-        time_norm = [(t - start_time).total_seconds() / 
-                    (end_time - start_time).total_seconds() 
-                    for t in times]
+        # Normalize timestamps to [0,1] for color mapping, in float epoch seconds
+        time_norm = _normalize_times(mission.ts_epoch, start_time, end_time)
         
         # Plot waypoints with time-based colors
         scatter = self.ax.scatter(x, y, z, c=time_norm, cmap=self.time_cmap, 
                                 s=100, label=label or mission.drone_id)
         
-        # Plot path with time-based colors
-        for i in range(len(x)-1):
-            self.ax.plot(x[i:i+2], y[i:i+2], z[i:i+2], 
-                        color=self.time_cmap(time_norm[i]), 
-                        linestyle='-', linewidth=2)
+        # Plot path with time-based colors: one collection of its segments,
+        # each colored by the time of the waypoint it starts from
+        if len(x) > 1:
+            segments = np.stack([mission.xyz[:-1], mission.xyz[1:]], axis=1)
+            path = Line3DCollection(segments, cmap=self.time_cmap, norm=mcolors.Normalize(vmin=0, vmax=1),
+                                    linestyles='-', linewidths=2)
+            path.set_array(time_norm[:-1])
+            self.ax.add_collection3d(path)
         
         # Add waypoint labels with time information
-        for i, (xi, yi, zi, ti) in enumerate(zip(x, y, z, times)):
-            time_str = ti.strftime('%H:%M:%S')
-            self.ax.text(xi, yi, zi, f'WP{i+1}\n{time_str}', 
-                        color=self.time_cmap(time_norm[i]))
+        if show_labels:
+            # One colormap lookup for all labels rather than one per label
+            labels = [f'WP{i+1}\n{time}' for i, time in enumerate(mission.time_strs)]
+            label_colors = self.time_cmap(time_norm)
+            for xi, yi, zi, label_text, color in zip(x, y, z, labels, label_colors):
+                self.ax.text(xi, yi, zi, label_text, color=color)
         
         return scatter
     
@@ -308,44 +697,42 @@ class MissionPlotter:
                          end_time: datetime):
         """Plot conflicts in 4D (3D space + time as color)."""
         self.conflicts = conflicts
+        if not conflicts:
+            return
         
-        for conflict in conflicts:
-            # Normalize conflict time for color mapping
-            time_norm = (conflict.time - start_time).total_seconds() / \
-                       (end_time - start_time).total_seconds()
-            
-            # Plot conflict point with time-based color
-            self.ax.scatter(
-                conflict.location[0], 
-                conflict.location[1], 
-                0,  # Set z-coordinate to 0 for 2D conflicts
-                color=self.time_cmap(time_norm),
-                s=200, 
-                marker='*',
-                label=f'Conflict at {conflict.time.strftime("%H:%M:%S")}'
-            )
-            
-            # Plot safety buffer circle (2D)
-            theta = np.linspace(0, 2 * np.pi, 100)
-            x = conflict.location[0] + conflict.distance * np.cos(theta)
-            y = conflict.location[1] + conflict.distance * np.sin(theta)
-            z = np.zeros_like(x)  # All points at z=0
-            
-            self.ax.plot(x, y, z, color=self.time_cmap(time_norm), 
-                        alpha=0.2, label='Safety Buffer')
-            
+        # Plot safety buffer circles (2D), colored by conflict time, as one collection
+        time_norms = _normalize_times(
+            np.array([to_epoch(conflict.time) for conflict in conflicts]), start_time, end_time
+        )
+        colors = self.time_cmap(time_norms)
+        locs, circles = _conflict_circles(conflicts)
+        self._add_circles(Line3DCollection(
+            circles, colors=colors, alpha=0.2, label='Safety Buffer'
+        ), circles)
+        
+        # Plot conflict points with time-based colors, all in one scatter
+        # (z = 0 for 2D conflicts)
+        label = (f'Conflict at {conflicts[0].time_str}'
+                 if len(conflicts) == 1 else 'Conflicts')
+        self.ax.scatter(locs[:, 0], locs[:, 1], 0, c=colors, s=200, marker='*', label=label)
+        
+        for conflict, color in zip(conflicts, colors):
             # Add conflict label with time
             self.ax.text(
                 conflict.location[0], 
                 conflict.location[1], 
                 0,  # Set z-coordinate to 0 for 2D conflicts
-                f'Conflict\n{conflict.time.strftime("%H:%M:%S")}\n{conflict.conflicting_drone}',
-                color=self.time_cmap(time_norm)
+                f'Conflict\n{conflict.time_str}\n{conflict.conflicting_drone}',
+                color=color
             )
     
     def plot_4d_all_missions(self, missions: Dict[str, List[Mission]], 
-                           conflicts: Optional[List[Conflict]] = None):
-        """Plot all missions and conflicts in 4D (3D space + time as color)."""
+                           conflicts: Optional[List[Conflict]] = None,
+                           show_labels: bool = False):
+        """Plot all missions and conflicts in 4D (3D space + time as color).
+        
+        Waypoint time labels are only added if show_labels is set.
+        """
         # Clear previous plot
         self.ax.clear()
         
@@ -365,7 +752,8 @@ class MissionPlotter:
             start_time, 
             end_time,
             color='red', 
-            label='Primary Drone'
+            label='Primary Drone',
+            show_labels=show_labels
         )
         
         # Plot traffic drones
@@ -376,7 +764,8 @@ class MissionPlotter:
                 mission, 
                 start_time, 
                 end_time,
-                color=colors[i % len(colors)]
+                color=colors[i % len(colors)],
+                show_labels=show_labels
             )
             scatters.append(scatter)
         
@@ -394,7 +783,7 @@ class MissionPlotter:
         norm = mcolors.Normalize(vmin=0, vmax=1)
         sm = plt.cm.ScalarMappable(cmap=self.time_cmap, norm=norm)
         sm.set_array([])
-        cbar = plt.colorbar(sm, ax=self.ax)
+        cbar = self.fig.colorbar(sm, ax=self.ax)
         cbar.set_label('Time Progression')
         
         # Add legend
@@ -407,10 +796,13 @@ class MissionPlotter:
         self.ax.set_box_aspect([1, 1, 1])
         
         # Force a redraw
-        plt.draw()
+        self.fig.canvas.draw_idle()
     
     def save_4d_visualization(self, filename: str):
         """Save the 4D visualization to a file."""
-        plt.tight_layout()
-        plt.savefig(filename, dpi=300, bbox_inches='tight')
-        plt.close() 
\ No newline at end of file
+        if _render_disabled():
+            plt.close(self.fig)
+            return
+        self.fig.tight_layout()
+        self.fig.savefig(filename, dpi=300, bbox_inches='tight')
+        plt.close(self.fig) 
\ No newline at end of file